@@ -45,8 +45,9 @@ class DataUploadComponent:
                 df = self.processor.load_file(uploaded_file)
             
             if df is not None:
-                # Store in session state
+                # Store in session state; the previous frame's cached profile no longer applies
                 st.session_state.uploaded_data = df
+                st.session_state.pop('data_profile_cache', None)
                 
                 # Store uploaded file name for suite naming
                 uploaded_filename = uploaded_file.name
@@ -100,7 +101,7 @@ class DataUploadComponent:
             st.metric("Columns", len(df.columns))
         
         with col3:
-            memory_mb = df.memory_usage(deep=True).sum() / (1024 * 1024)
+            memory_mb = self.processor.estimate_memory_usage(df) / (1024 * 1024)
             st.metric("Memory Usage", f"{memory_mb:.1f} MB")
         
         with col4:
@@ -113,9 +114,16 @@ class DataUploadComponent:
             st.warning("No data available for profiling!")
             return
         
-        # Generate profile
-        with st.spinner("Generating data profile..."):
-            profile = self.processor.get_data_profile(df)
+        # Generate profile; download buttons rerun the page, so the profile of the
+        # current frame is kept in the session until a different frame is shown
+        cached = st.session_state.get('data_profile_cache')
+        if cached is not None and cached[0] is df:
+            profile = cached[1]
+        else:
+            with st.spinner("Generating data profile..."):
+                profile = self.processor.get_data_profile(df)
+            if profile:
+                st.session_state.data_profile_cache = (df, profile)
         
         if not profile:
             st.error("Failed to generate data profile!")
@@ -345,6 +353,8 @@ class DataUploadComponent:
             most_common = col_info.get('most_common', {})
             for value, count in list(most_common.items())[:5]:
                 st.write(f"{value}: {count}")
+            if col_info.get('most_common_skipped_high_cardinality'):
+                st.write(f"Skipped: {col_info.get('unique_count', 0):,} distinct values")
         
         # Value counts chart
         if most_common:
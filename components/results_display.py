@@ -688,7 +688,7 @@ class ResultsDisplayComponent:
                 'uploaded_data', 'uploaded_filename', 'data_context',
                 'expectation_configs', 'expectation_suite', 'current_suite_name',
                 'validation_results', 'validation_completed', 'failed_records_data',
-                'ge_helpers', 'current_step'
+                'ge_helpers', 'current_step', 'data_profile_cache'
             ]
             
             for key in keys_to_clear:
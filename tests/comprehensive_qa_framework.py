@@ -37,6 +37,18 @@ from components.custom_sql_expectations import CustomSQLExpectation
 # from utils.data_processing import DataProcessor  # Not needed for basic testing
 
 
+def write_csv(df: pd.DataFrame, filename: str):
+    """Write a results DataFrame to CSV, using Arrow's C++ writer when available"""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pcsv
+    except ImportError:
+        df.to_csv(filename, index=False)
+        return
+    
+    pcsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), filename)
+
+
 @dataclass
 class TestResult:
     """Test result data structure"""
@@ -0,0 +1,52 @@
+"""
+Shared pytest fixtures for the test scripts
+"""
+
+import os
+import sys
+
+# Put the project root on the path once for the whole session
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import pytest
+
+from components.custom_sql_expectations import CustomSQLExpectation
+
+ISSUE_DATA_PATH = 'sample_data/test_data_with_issues.csv'
+
+
+def pytest_configure(config):
+    """Register the runtime-class markers used to split the suite across workers"""
+    config.addinivalue_line('markers', 'slow_network: test makes live network calls (OpenAI)')
+    config.addinivalue_line('markers', 'cpu_heavy: test spends most of its time in CPU-bound work')
+
+
+@pytest.fixture(scope='session')
+def issue_data():
+    """Sample data with known quality issues, parsed once per test session"""
+    return pd.read_csv(ISSUE_DATA_PATH)
+
+
+@pytest.fixture(scope='session')
+def custom_sql():
+    """A single CustomSQLExpectation shared by the SQL tests"""
+    return CustomSQLExpectation()
+
+
+@pytest.fixture(scope='session')
+def issue_sql(issue_data):
+    """Run a {table_name} query against issue_data on one persistent pandasql engine
+
+    The frame is written to SQLite on the first query and reused afterwards. The
+    engine stays inside this fixture and only ever sees issue_data, so its loaded
+    table cannot go stale.
+    """
+    pandasql = pytest.importorskip('pandasql')
+    engine = pandasql.PandaSQL(persist=True)
+    env = {'data_table': issue_data}
+    
+    def run(sql_query):
+        return engine(sql_query.replace('{table_name}', 'data_table'), env)
+    
+    return run
@@ -13,22 +13,36 @@ Usage:
 """
 
 import pandas as pd
+import io
 import sys
 import os
+import re
+from contextlib import redirect_stdout
 from pathlib import Path
+from typing import Dict
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from tests.comprehensive_qa_framework import SyntheticDataGenerator, ComprehensiveQATester
 
+# Scenarios built with deliberate data issues, where a failure is the correct outcome
+EXPECTED_FAILURE_SCENARIOS = 'nulls|duplicates|violations|issues'
+# Scenarios where a failure points at a real problem
+UNEXPECTED_FAILURE_SCENARIOS = 'clean_data_pass|edge_cases'
+
+# Shared by all debugger instances, which only ever read from them
+_DATA_GEN = SyntheticDataGenerator()
+_QA_TESTER = ComprehensiveQATester()
+_SCENARIO_DATA_CACHE: Dict[str, pd.DataFrame] = {}
+
 
 class FailedTestDebugger:
     """Debug and fix failed QA tests"""
     
     def __init__(self):
-        self.data_generator = SyntheticDataGenerator()
-        self.tester = ComprehensiveQATester()
+        self.data_generator = _DATA_GEN
+        self.tester = _QA_TESTER
     
     def debug_failures(self, csv_file: str):
         """Debug all failed tests from CSV results"""
@@ -38,7 +52,7 @@ class FailedTestDebugger:
             return
         
         # Load results and filter failures
-        df = pd.read_csv(csv_file)
+        df = pd.read_csv(csv_file, memory_map=True, low_memory=False, dtype={'test_passed': 'bool'})
         failed_tests = df[df['test_passed'] == False]
         
         if failed_tests.empty:
@@ -51,9 +65,13 @@ class FailedTestDebugger:
         print("-" * 60)
         
         for idx, (_, test) in enumerate(failed_tests.iterrows(), 1):
-            print(f"\n🚨 FAILURE #{idx}")
-            self.debug_single_failure(test)
-            print("-" * 60)
+            # Collect each failure report and write it to stdout in one call
+            buf = io.StringIO()
+            with redirect_stdout(buf):
+                print(f"\n🚨 FAILURE #{idx}")
+                self.debug_single_failure(test)
+                print("-" * 60)
+            sys.stdout.write(buf.getvalue())
         
         # Provide overall recommendations
         self.provide_fix_recommendations(failed_tests)
@@ -73,6 +91,13 @@ class FailedTestDebugger:
         print(f"🎯 Expected: {expected}")
         print(f"📊 Actual: {actual}")
         
+        # Bad-data scenarios are meant to fail, so skip regenerating and scanning their data
+        if re.search(EXPECTED_FAILURE_SCENARIOS, test_scenario):
+            print(f"\n💡 SUGGESTED FIXES:")
+            print(f"   ✅ This failure is EXPECTED - {test_scenario} data contains deliberate issues")
+            print(f"   🔧 No fix needed - test is working correctly")
+            return
+        
         # Re-create the test scenario to investigate
         print(f"\n🔬 RECREATING TEST SCENARIO...")
         try:
@@ -82,7 +107,7 @@ class FailedTestDebugger:
             
             # Show data sample
             print("📋 Data sample:")
-            print(data.head(3).to_string())
+            data.head(3).to_csv(sys.stdout, sep='\t', index=False)
             
             # Show data quality issues
             self.analyze_data_issues(data, expectation_type)
@@ -96,6 +121,14 @@ class FailedTestDebugger:
     def recreate_test_data(self, test_scenario: str) -> pd.DataFrame:
         """Recreate the exact test data that caused the failure"""
         
+        # Many failures share a scenario, so generate each dataset only once
+        if test_scenario not in _SCENARIO_DATA_CACHE:
+            _SCENARIO_DATA_CACHE[test_scenario] = self._generate_test_data(test_scenario)
+        return _SCENARIO_DATA_CACHE[test_scenario]
+    
+    def _generate_test_data(self, test_scenario: str) -> pd.DataFrame:
+        """Generate fresh test data for a scenario"""
+        
         data_generators = {
             'clean_data_pass': self.data_generator.generate_clean_dataset,
             'with_nulls_fail': self.data_generator.generate_dataset_with_nulls, 
@@ -113,8 +146,8 @@ class FailedTestDebugger:
             else:
                 return generator(rows=100)  # Same as in tests
         else:
-            # Default to clean data
-            return self.data_generator.generate_clean_dataset(100)
+            # Default to the (cached) clean data
+            return self.recreate_test_data('clean_data_pass')
     
     def analyze_data_issues(self, data: pd.DataFrame, expectation_type: str):
         """Analyze what might be wrong with the test data"""
@@ -152,7 +185,7 @@ class FailedTestDebugger:
         
         # Check string columns
         if 'email' in data.columns:
-            invalid_emails = ~data['email'].astype(str).str.contains('@', na=False)
+            invalid_emails = ~data['email'].str.contains('@', regex=False, na=False)
             if invalid_emails.any():
                 invalid_count = invalid_emails.sum()
                 print(f"   📧 Invalid email formats: {invalid_count}")
@@ -218,10 +251,10 @@ class FailedTestDebugger:
         
         # Count failure types
         unexpected_failures = failed_tests[
-            failed_tests['test_scenario'].str.contains('clean_data_pass|edge_cases')
+            failed_tests['test_scenario'].str.contains(UNEXPECTED_FAILURE_SCENARIOS)
         ]
         expected_failures = failed_tests[
-            failed_tests['test_scenario'].str.contains('nulls|duplicates|violations|issues')
+            failed_tests['test_scenario'].str.contains(EXPECTED_FAILURE_SCENARIOS)
         ]
         
         print(f"📊 Failure breakdown:")
@@ -235,7 +268,7 @@ class FailedTestDebugger:
             print(f"\n🔧 PRIORITY FIXES NEEDED:")
             
             # Group by expectation type
-            problem_expectations = unexpected_failures.groupby('expectation_type').size().sort_values(ascending=False)
+            problem_expectations = unexpected_failures['expectation_type'].value_counts()
             
             for exp_type, count in problem_expectations.items():
                 short_name = exp_type.replace('expect_', '').replace('_', ' ').title()
@@ -18,7 +18,7 @@ def debug_failures(csv_file):
         return
     
     # Load results
-    df = pd.read_csv(csv_file)
+    df = pd.read_csv(csv_file, memory_map=True, low_memory=False, dtype={'test_passed': 'bool'})
     failed_tests = df[df['test_passed'] == False]
     
     if failed_tests.empty:
@@ -30,32 +30,35 @@ def debug_failures(csv_file):
     print(f"Found {len(failed_tests)} failed tests out of {len(df)} total")
     print()
     
-    # Show each failure
+    # Show each failure, writing every block to stdout in one call
     for idx, (_, test) in enumerate(failed_tests.iterrows(), 1):
-        print(f"FAILURE #{idx}:")
-        print(f"  Expectation: {test['expectation_type']}")
-        print(f"  Scenario: {test['test_scenario']}")
-        print(f"  Expected: {test['expected_outcome']}")
-        print(f"  Actual: {test['actual_outcome']}")
+        buf = [
+            f"FAILURE #{idx}:\n",
+            f"  Expectation: {test['expectation_type']}\n",
+            f"  Scenario: {test['test_scenario']}\n",
+            f"  Expected: {test['expected_outcome']}\n",
+            f"  Actual: {test['actual_outcome']}\n",
+        ]
         
         if pd.notna(test.get('error_message')):
-            print(f"  Error: {test['error_message']}")
+            buf.append(f"  Error: {test['error_message']}\n")
         
         # Simple diagnosis
         scenario = test['test_scenario']
         exp_type = test['expectation_type']
         
         if 'clean_data_pass' in scenario:
-            print("  DIAGNOSIS: This is UNEXPECTED - clean data should pass")
-            print("  ACTION NEEDED: Check expectation implementation")
+            buf.append("  DIAGNOSIS: This is UNEXPECTED - clean data should pass\n")
+            buf.append("  ACTION NEEDED: Check expectation implementation\n")
         elif any(x in scenario for x in ['nulls', 'duplicates', 'violations', 'issues', 'format']):
-            print("  DIAGNOSIS: This is EXPECTED - bad data should fail")
-            print("  ACTION: None - test working correctly")
+            buf.append("  DIAGNOSIS: This is EXPECTED - bad data should fail\n")
+            buf.append("  ACTION: None - test working correctly\n")
         elif 'edge_cases' in scenario:
-            print("  DIAGNOSIS: Edge case failure - may be expected")
-            print("  ACTION: Review if this should pass or fail")
+            buf.append("  DIAGNOSIS: Edge case failure - may be expected\n")
+            buf.append("  ACTION: Review if this should pass or fail\n")
         
-        print("-" * 40)
+        buf.append("-" * 40 + "\n")
+        sys.stdout.write(''.join(buf))
     
     # Summary recommendations
     unexpected_failures = failed_tests[
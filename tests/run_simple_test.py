@@ -7,11 +7,14 @@ Runs basic QA tests and outputs to CSV without any Unicode issues.
 
 import pandas as pd
 import numpy as np
+import csv
+import io
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime
 from typing import Dict, List, Any
-import random
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -19,43 +22,64 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from utils.ge_helpers import GEHelpers
 from components.custom_sql_expectations import CustomSQLExpectation
 
+# Columns of the results CSV; rows without an error leave error_message empty
+RESULT_FIELDS = ['expectation_type', 'test_scenario', 'test_passed', 'data_rows', 'data_columns', 'error_message']
+
 
 class SimpleDataGenerator:
     """Generate test data without external dependencies"""
     
     def __init__(self):
-        random.seed(42)
-        np.random.seed(42)
+        # Per-instance generator instead of seeding the global random state
+        self.rng = np.random.default_rng(42)
+        self._clean_cache = {}
     
     def generate_clean_data(self, rows=100):
-        """Generate clean test data"""
+        """Generate clean test data (cached per row count, treat as read-only)"""
+        if rows in self._clean_cache:
+            return self._clean_cache[rows]
+        
+        ids = np.arange(1, rows + 1)
+        ids_str = ids.astype(str)
         data = {
-            'id': range(1, rows + 1),
-            'name': [f'Person_{i}' for i in range(1, rows + 1)],
-            'email': [f'user{i}@example.com' for i in range(1, rows + 1)],
-            'age': np.random.randint(18, 80, rows),
-            'salary': np.random.normal(50000, 15000, rows).round(2),
-            'category': np.random.choice(['A', 'B', 'C', 'D'], rows),
+            'id': ids,
+            'name': np.char.add('Person_', ids_str),
+            'email': np.char.add(np.char.add('user', ids_str), '@example.com'),
+            'age': self.rng.integers(18, 80, rows),
+            'salary': self.rng.normal(50000, 15000, rows).round(2),
+            'category': pd.Categorical(
+                self.rng.choice(['A', 'B', 'C', 'D'], rows), categories=['A', 'B', 'C', 'D']
+            ),
         }
-        return pd.DataFrame(data)
+        # Arrow-backed strings avoid one Python object per cell
+        self._clean_cache[rows] = pd.DataFrame(data).astype(
+            {'name': 'string[pyarrow]', 'email': 'string[pyarrow]'}
+        )
+        return self._clean_cache[rows]
+    
+    def _random_mask(self, rows, fraction):
+        """Boolean mask selecting a random fraction of rows"""
+        mask = np.zeros(rows, dtype=bool)
+        mask[self.rng.choice(rows, size=int(rows * fraction), replace=False)] = True
+        return mask
     
     def generate_data_with_nulls(self, rows=100):
         """Generate data with null values"""
-        df = self.generate_clean_data(rows)
+        # Shallow copy of the cached clean data; only the replaced column is new
+        df = self.generate_clean_data(rows).copy(deep=False)
         
         # Add nulls to some records
-        null_indices = np.random.choice(rows, size=int(rows * 0.1), replace=False)
-        df.loc[null_indices, 'name'] = None
+        df['name'] = df['name'].mask(self._random_mask(rows, 0.1))
         
         return df
     
     def generate_data_with_duplicates(self, rows=100):
         """Generate data with duplicate IDs"""
-        df = self.generate_clean_data(rows)
+        # Shallow copy of the cached clean data; only the replaced column is new
+        df = self.generate_clean_data(rows).copy(deep=False)
         
         # Add duplicate IDs
-        duplicate_indices = np.random.choice(rows, size=int(rows * 0.05), replace=False)
-        df.loc[duplicate_indices, 'id'] = 1  # Make them all ID 1
+        df['id'] = df['id'].mask(self._random_mask(rows, 0.05), 1)  # Make them all ID 1
         
         return df
 
@@ -63,10 +87,22 @@ class SimpleDataGenerator:
 class SimpleQATester:
     """Simple QA tester"""
     
-    def __init__(self):
+    def __init__(self, scenarios=None):
         self.ge_helpers = GEHelpers()
         self.data_gen = SimpleDataGenerator()
-        self.results = []
+        
+        # Results are streamed to CSV, only the summary counts and failures are kept
+        self.results_file = None
+        self.total_tests = 0
+        self.passed_tests = 0
+        self.failed_tests = []
+        
+        # Test scenarios are read-only, so build them once and share across expectation types
+        self.scenarios = scenarios or {
+            'clean_data': self.data_gen.generate_clean_data(),
+            'with_nulls': self.data_gen.generate_data_with_nulls(),
+            'with_duplicates': self.data_gen.generate_data_with_duplicates()
+        }
         
         # Common expectation types to test
         self.expectation_types = [
@@ -83,38 +119,59 @@ class SimpleQATester:
         print(f"Testing {len(self.expectation_types)} expectation types")
         print("-" * 50)
         
-        for exp_type in self.expectation_types:
-            print(f"\nTesting: {exp_type}")
-            self.test_expectation_type(exp_type)
+        # Expectation types are independent, so test them in worker processes that
+        # share the scenarios; each worker's output is printed as one block, in order
+        max_workers = min(len(self.expectation_types), os.cpu_count() or 1)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.results_file = f"simple_qa_results_{timestamp}.csv"
         
-        return self.results
+        # Write result rows as they arrive instead of collecting them into a DataFrame
+        with open(self.results_file, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+            writer.writeheader()
+            with ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_worker, initargs=(self.scenarios,)
+            ) as executor:
+                for output, results in executor.map(_run_expectation_type, self.expectation_types):
+                    sys.stdout.write(output)
+                    writer.writerows(results)
+                    self._record_results(results)
+        
+        return self.results_file
+    
+    def _record_results(self, results):
+        """Update the summary counts from a batch of result rows"""
+        for result in results:
+            self.total_tests += 1
+            if result['test_passed']:
+                self.passed_tests += 1
+            else:
+                self.failed_tests.append(f"{result['expectation_type']} - {result['test_scenario']}")
     
     def test_expectation_type(self, exp_type):
-        """Test one expectation type with multiple scenarios"""
-        
-        scenarios = {
-            'clean_data': self.data_gen.generate_clean_data(),
-            'with_nulls': self.data_gen.generate_data_with_nulls(),
-            'with_duplicates': self.data_gen.generate_data_with_duplicates()
-        }
+        """Test one expectation type with multiple scenarios and return the results"""
         
-        for scenario_name, data in scenarios.items():
+        print(f"\nTesting: {exp_type}")
+        results = []
+        for scenario_name, data in self.scenarios.items():
+            shape = data.shape
             try:
                 print(f"  {scenario_name}...", end=" ")
+                columns = set(data.columns)
                 
                 # Create expectation config
                 config = self.create_expectation_config(exp_type, data)
                 
                 if config:
                     # Test the expectation (simplified simulation)
-                    success = self.test_expectation(exp_type, scenario_name, data, config)
+                    success = self.test_expectation(exp_type, scenario_name, data, config, columns)
                     
-                    self.results.append({
+                    results.append({
                         'expectation_type': exp_type,
                         'test_scenario': scenario_name,
                         'test_passed': success,
-                        'data_rows': len(data),
-                        'data_columns': len(data.columns)
+                        'data_rows': shape[0],
+                        'data_columns': shape[1]
                     })
                     
                     print("PASS" if success else "FAIL")
@@ -123,14 +180,16 @@ class SimpleQATester:
                     
             except Exception as e:
                 print(f"ERROR: {str(e)}")
-                self.results.append({
+                results.append({
                     'expectation_type': exp_type,
                     'test_scenario': scenario_name,
                     'test_passed': False,
-                    'data_rows': len(data) if 'data' in locals() else 0,
-                    'data_columns': len(data.columns) if 'data' in locals() else 0,
+                    'data_rows': shape[0],
+                    'data_columns': shape[1],
                     'error_message': str(e)
                 })
+        
+        return results
     
     def create_expectation_config(self, exp_type, data):
         """Create expectation configuration"""
@@ -177,36 +236,37 @@ class SimpleQATester:
         
         return None
     
-    def test_expectation(self, exp_type, scenario, data, config):
+    def test_expectation(self, exp_type, scenario, data, config, columns=None):
         """Simple expectation testing logic"""
         
+        if columns is None:
+            columns = set(data.columns)
+        
         try:
             kwargs = config.get('kwargs', {})
             
             if exp_type == "expect_column_values_to_not_be_null":
                 column = kwargs.get('column')
-                if column in data.columns:
-                    null_count = data[column].isnull().sum()
+                if column in columns:
                     # Clean data should pass, data with nulls should fail
                     if scenario == 'clean_data':
-                        return null_count == 0
+                        return not data[column].isna().any()
                     elif scenario == 'with_nulls':
-                        return null_count == 0  # This should fail
+                        return not data[column].isna().any()  # This should fail
                     else:
-                        return null_count == 0
+                        return not data[column].isna().any()
             
             elif exp_type == "expect_column_values_to_be_unique":
                 column = kwargs.get('column')
-                if column in data.columns:
-                    unique_count = data[column].nunique()
-                    total_count = len(data[column].dropna())
+                if column in columns:
+                    has_duplicates = data[column].dropna().duplicated().any()
                     # Clean data should pass, data with duplicates should fail
                     if scenario == 'clean_data':
-                        return unique_count == total_count
+                        return not has_duplicates
                     elif scenario == 'with_duplicates':
-                        return unique_count == total_count  # This should fail
+                        return not has_duplicates  # This should fail
                     else:
-                        return unique_count == total_count
+                        return not has_duplicates
             
             elif exp_type == "expect_table_row_count_to_be_between":
                 row_count = len(data)
@@ -217,53 +277,68 @@ class SimpleQATester:
             elif exp_type == "expect_column_values_to_be_in_set":
                 column = kwargs.get('column')
                 value_set = set(kwargs.get('value_set', []))
-                if column in data.columns:
-                    data_values = set(data[column].dropna())
-                    return data_values.issubset(value_set)
+                if column in columns:
+                    if isinstance(data[column].dtype, pd.CategoricalDtype):
+                        # Only the small category dictionary needs checking
+                        return bool(data[column].cat.categories.isin(value_set).all())
+                    return bool(data[column].dropna().isin(tuple(value_set)).all())
             
             elif exp_type == "expect_column_values_to_be_between":
                 column = kwargs.get('column')
                 min_val = kwargs.get('min_value', float('-inf'))
                 max_val = kwargs.get('max_value', float('inf'))
-                if column in data.columns:
-                    out_of_range = ((data[column] < min_val) | (data[column] > max_val)).sum()
-                    return out_of_range == 0
+                if column in columns:
+                    # Compare the column's min/max instead of building and OR-ing two masks;
+                    # NaNs are skipped and an all-null column passes
+                    values = data[column]
+                    if values.isna().all():
+                        return True
+                    return bool(values.min() >= min_val and values.max() <= max_val)
             
             return True  # Default pass
             
         except Exception:
             return False
     
-    def save_results_to_csv(self):
-        """Save results to CSV"""
-        if not self.results:
+    def print_summary(self):
+        """Print where results were saved and a summary of the run"""
+        if not self.total_tests:
             print("No results to save")
             return
         
-        df = pd.DataFrame(self.results)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"simple_qa_results_{timestamp}.csv"
-        df.to_csv(filename, index=False)
-        
-        print(f"\nResults saved to: {filename}")
+        print(f"\nResults saved to: {self.results_file}")
         
         # Print summary
-        total_tests = len(df)
-        passed_tests = df['test_passed'].sum()
-        success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
+        success_rate = self.passed_tests / self.total_tests * 100
         
         print(f"\nSUMMARY:")
-        print(f"Total tests: {total_tests}")
-        print(f"Passed: {passed_tests}")
-        print(f"Failed: {total_tests - passed_tests}")
+        print(f"Total tests: {self.total_tests}")
+        print(f"Passed: {self.passed_tests}")
+        print(f"Failed: {self.total_tests - self.passed_tests}")
         print(f"Success rate: {success_rate:.1f}%")
         
         # Show failures
-        failed_tests = df[df['test_passed'] == False]
-        if not failed_tests.empty:
+        if self.failed_tests:
             print(f"\nFAILED TESTS:")
-            for _, row in failed_tests.iterrows():
-                print(f"  {row['expectation_type']} - {row['test_scenario']}")
+            print('\n'.join(f"  {failure}" for failure in self.failed_tests))
+
+
+# Tester owned by each worker process, built once from the shared scenarios
+_worker_tester = None
+
+
+def _init_worker(scenarios):
+    """Process pool initializer: build this worker's tester"""
+    global _worker_tester
+    _worker_tester = SimpleQATester(scenarios=scenarios)
+
+
+def _run_expectation_type(exp_type):
+    """Test one expectation type in a worker, returning its buffered output and results"""
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        results = _worker_tester.test_expectation_type(exp_type)
+    return buf.getvalue(), results
 
 
 def main():
@@ -273,7 +348,7 @@ def main():
     
     tester = SimpleQATester()
     tester.run_tests()
-    tester.save_results_to_csv()
+    tester.print_summary()
     
     return 0
 
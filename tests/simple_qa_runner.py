@@ -6,7 +6,10 @@ Runs comprehensive tests for all data quality expectation types and outputs resu
 Much simpler than a dashboard - just run it and get your results in a spreadsheet.
 
 Usage:
-    python tests/simple_qa_runner.py
+    python tests/simple_qa_runner.py [1|2|3]
+
+    Without an option the runner prompts for one, or runs option 1 when stdin
+    is not a terminal (CI, pipes).
 
 Output:
     - qa_test_results.csv: Detailed test results
@@ -22,17 +25,45 @@ Features:
 
 import pandas as pd
 import numpy as np
+import csv
 import sys
 import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 import random
 import traceback
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from comprehensive_qa_framework import ComprehensiveQATester, SyntheticDataGenerator
+from comprehensive_qa_framework import ComprehensiveQATester, SyntheticDataGenerator, write_csv
+
+# Columns of the detailed results CSV, in order
+RESULT_FIELDS = [
+    'timestamp', 'expectation_type', 'expectation_category', 'test_scenario',
+    'expected_outcome', 'actual_outcome', 'test_passed', 'execution_time_seconds',
+    'data_rows', 'data_columns', 'error_message', 'has_error'
+]
+
+
+@lru_cache(maxsize=None)
+def _expectation_category(expectation_type: str) -> str:
+    """Categorize an expectation type (cached, there are only a handful of types)"""
+    if 'table' in expectation_type:
+        return 'table_level'
+    elif any(stat in expectation_type for stat in ['mean', 'median', 'stdev', 'sum']):
+        return 'statistical'
+    elif any(fmt in expectation_type for fmt in ['regex', 'format', 'dateutil', 'strftime']):
+        return 'format_pattern'
+    elif 'custom_sql' in expectation_type:
+        return 'custom_sql'
+    elif 'column' in expectation_type:
+        return 'column_validation'
+    else:
+        return 'other'
 
 
 class SimpleQARunner:
@@ -71,164 +102,121 @@ class SimpleQARunner:
     
     def save_results_to_csv(self):
         """Save detailed test results to CSV"""
-        results_data = []
-        
-        for result in self.tester.results:
-            results_data.append({
-                'timestamp': self.timestamp,
-                'expectation_type': result.expectation_type,
-                'expectation_category': self.get_expectation_category(result.expectation_type),
-                'test_scenario': result.test_scenario,
-                'expected_outcome': result.expected_outcome,
-                'actual_outcome': result.actual_outcome,
-                'test_passed': result.success,
-                'execution_time_seconds': result.execution_time,
-                'data_rows': result.data_shape[0] if result.data_shape else None,
-                'data_columns': result.data_shape[1] if result.data_shape else None,
-                'error_message': result.error_message,
-                'has_error': result.error_message is not None
-            })
-        
-        df = pd.DataFrame(results_data)
+        results = self.tester.results
         filename = f"qa_test_results_{self.timestamp}.csv"
-        df.to_csv(filename, index=False)
+        
+        # Write one row per result as it is read instead of building a DataFrame first
+        with open(filename, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+            writer.writeheader()
+            for r in results:
+                writer.writerow({
+                    'timestamp': self.timestamp,
+                    'expectation_type': r.expectation_type,
+                    'expectation_category': self.get_expectation_category(r.expectation_type),
+                    'test_scenario': r.test_scenario,
+                    'expected_outcome': r.expected_outcome,
+                    'actual_outcome': r.actual_outcome,
+                    'test_passed': r.success,
+                    'execution_time_seconds': r.execution_time,
+                    'data_rows': r.data_shape[0] if r.data_shape else None,
+                    'data_columns': r.data_shape[1] if r.data_shape else None,
+                    'error_message': r.error_message,
+                    'has_error': r.error_message is not None
+                })
         
         print(f"Detailed results saved: {filename}")
-        print(f"   {len(df)} test results")
+        print(f"   {len(results)} test results")
     
     def save_summary_to_csv(self, summary):
         """Save test summary to CSV"""
-        summary_data = []
-        
-        # Overall summary
-        summary_data.append({
-            'timestamp': self.timestamp,
-            'metric_type': 'overall',
-            'metric_name': 'total_tests',
-            'value': summary.total_tests,
-            'percentage': 100.0
-        })
+        # Collect the summary column-wise rather than from one dict per metric
+        metric_types, metric_names, values, percentages = [], [], [], []
         
-        summary_data.append({
-            'timestamp': self.timestamp,
-            'metric_type': 'overall',
-            'metric_name': 'passed_tests',
-            'value': summary.passed_tests,
-            'percentage': (summary.passed_tests / summary.total_tests * 100) if summary.total_tests > 0 else 0
-        })
-        
-        summary_data.append({
-            'timestamp': self.timestamp,
-            'metric_type': 'overall',
-            'metric_name': 'failed_tests',
-            'value': summary.failed_tests,
-            'percentage': (summary.failed_tests / summary.total_tests * 100) if summary.total_tests > 0 else 0
-        })
+        def add_metric(metric_type, metric_name, value, percentage):
+            metric_types.append(metric_type)
+            metric_names.append(metric_name)
+            values.append(value)
+            percentages.append(percentage)
         
-        summary_data.append({
-            'timestamp': self.timestamp,
-            'metric_type': 'overall',
-            'metric_name': 'success_rate',
-            'value': summary.success_rate,
-            'percentage': summary.success_rate
-        })
+        # Overall summary
+        add_metric('overall', 'total_tests', summary.total_tests, 100.0)
+        add_metric(
+            'overall', 'passed_tests', summary.passed_tests,
+            (summary.passed_tests / summary.total_tests * 100) if summary.total_tests > 0 else 0
+        )
+        add_metric(
+            'overall', 'failed_tests', summary.failed_tests,
+            (summary.failed_tests / summary.total_tests * 100) if summary.total_tests > 0 else 0
+        )
+        add_metric('overall', 'success_rate', summary.success_rate, summary.success_rate)
+        add_metric('overall', 'execution_time_seconds', summary.total_execution_time, None)
         
-        summary_data.append({
-            'timestamp': self.timestamp,
-            'metric_type': 'overall',
-            'metric_name': 'execution_time_seconds',
-            'value': summary.total_execution_time,
-            'percentage': None
-        })
+        expectation_stats, category_stats = self.calculate_stats()
         
         # Per-expectation summary
-        expectation_stats = self.calculate_expectation_stats()
         for exp_type, stats in expectation_stats.items():
-            summary_data.append({
-                'timestamp': self.timestamp,
-                'metric_type': 'by_expectation',
-                'metric_name': f"{exp_type}_total",
-                'value': stats['total'],
-                'percentage': None
-            })
-            
-            summary_data.append({
-                'timestamp': self.timestamp,
-                'metric_type': 'by_expectation', 
-                'metric_name': f"{exp_type}_passed",
-                'value': stats['passed'],
-                'percentage': (stats['passed'] / stats['total'] * 100) if stats['total'] > 0 else 0
-            })
+            add_metric('by_expectation', f"{exp_type}_total", stats['total'], None)
+            add_metric(
+                'by_expectation', f"{exp_type}_passed", stats['passed'],
+                (stats['passed'] / stats['total'] * 100) if stats['total'] > 0 else 0
+            )
         
         # By category summary  
-        category_stats = self.calculate_category_stats()
         for category, stats in category_stats.items():
-            summary_data.append({
-                'timestamp': self.timestamp,
-                'metric_type': 'by_category',
-                'metric_name': f"{category}_total",
-                'value': stats['total'],
-                'percentage': None
-            })
-            
-            summary_data.append({
-                'timestamp': self.timestamp,
-                'metric_type': 'by_category',
-                'metric_name': f"{category}_passed", 
-                'value': stats['passed'],
-                'percentage': (stats['passed'] / stats['total'] * 100) if stats['total'] > 0 else 0
-            })
+            add_metric('by_category', f"{category}_total", stats['total'], None)
+            add_metric(
+                'by_category', f"{category}_passed", stats['passed'],
+                (stats['passed'] / stats['total'] * 100) if stats['total'] > 0 else 0
+            )
         
-        df = pd.DataFrame(summary_data)
+        df = pd.DataFrame({
+            'timestamp': [self.timestamp] * len(metric_names),
+            'metric_type': metric_types,
+            'metric_name': metric_names,
+            'value': values,
+            'percentage': percentages
+        })
         filename = f"qa_summary_{self.timestamp}.csv"
-        df.to_csv(filename, index=False)
+        write_csv(df, filename)
         
         print(f"Summary saved: {filename}")
     
     def get_expectation_category(self, expectation_type: str) -> str:
         """Categorize expectation types"""
-        if 'table' in expectation_type:
-            return 'table_level'
-        elif any(stat in expectation_type for stat in ['mean', 'median', 'stdev', 'sum']):
-            return 'statistical'  
-        elif any(fmt in expectation_type for fmt in ['regex', 'format', 'dateutil', 'strftime']):
-            return 'format_pattern'
-        elif 'custom_sql' in expectation_type:
-            return 'custom_sql'
-        elif 'column' in expectation_type:
-            return 'column_validation'
-        else:
-            return 'other'
+        return _expectation_category(expectation_type)
     
-    def calculate_expectation_stats(self) -> Dict[str, Dict]:
-        """Calculate stats per expectation type"""
-        stats = {}
+    def calculate_stats(self) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+        """Calculate stats per expectation type and per category in one pass"""
+        total_by_exp, passed_by_exp = Counter(), Counter()
+        total_by_cat, passed_by_cat = Counter(), Counter()
         
         for result in self.tester.results:
             exp_type = result.expectation_type
-            if exp_type not in stats:
-                stats[exp_type] = {'total': 0, 'passed': 0}
-            
-            stats[exp_type]['total'] += 1
+            category = self.get_expectation_category(exp_type)
+            total_by_exp[exp_type] += 1
+            total_by_cat[category] += 1
             if result.success:
-                stats[exp_type]['passed'] += 1
+                passed_by_exp[exp_type] += 1
+                passed_by_cat[category] += 1
         
-        return stats
+        expectation_stats = {
+            exp_type: {'total': total, 'passed': passed_by_exp[exp_type]}
+            for exp_type, total in total_by_exp.items()
+        }
+        category_stats = {
+            category: {'total': total, 'passed': passed_by_cat[category]}
+            for category, total in total_by_cat.items()
+        }
+        return expectation_stats, category_stats
+    
+    def calculate_expectation_stats(self) -> Dict[str, Dict]:
+        """Calculate stats per expectation type"""
+        return self.calculate_stats()[0]
     
     def calculate_category_stats(self) -> Dict[str, Dict]:
         """Calculate stats per expectation category"""
-        stats = {}
-        
-        for result in self.tester.results:
-            category = self.get_expectation_category(result.expectation_type)
-            if category not in stats:
-                stats[category] = {'total': 0, 'passed': 0}
-            
-            stats[category]['total'] += 1
-            if result.success:
-                stats[category]['passed'] += 1
-        
-        return stats
+        return self.calculate_stats()[1]
     
     def run_quick_test(self, expectation_types: List[str] = None):
         """Run a quick test with specific expectation types"""
@@ -252,10 +240,17 @@ class SimpleQARunner:
             'edge_case_data': self.data_generator.generate_edge_case_dataset()
         }
         
-        for name, dataset in datasets.items():
-            filename = f"sample_{name}_{self.timestamp}.csv"
-            dataset.to_csv(filename, index=False)
-            print(f"   {filename}: {len(dataset)} rows, {len(dataset.columns)} columns")
+        # The files are independent, so write them concurrently
+        with ThreadPoolExecutor(max_workers=min(len(datasets), os.cpu_count() or 1)) as executor:
+            futures = {
+                name: executor.submit(dataset.to_csv, f"sample_{name}_{self.timestamp}.csv", index=False)
+                for name, dataset in datasets.items()
+            }
+        
+        for name, future in futures.items():
+            future.result()
+            dataset = datasets[name]
+            print(f"   sample_{name}_{self.timestamp}.csv: {len(dataset)} rows, {len(dataset.columns)} columns")
         
         print("Sample datasets generated!")
 
@@ -275,7 +270,13 @@ def main():
     print("3. Generate sample test datasets only")
     
     try:
-        choice = input("\nSelect option (1-3): ").strip()
+        # Accept the option as an argument and skip the prompt when not interactive
+        if len(sys.argv) > 1:
+            choice = sys.argv[1].strip()
+        elif sys.stdin.isatty():
+            choice = input("\nSelect option (1-3): ").strip()
+        else:
+            choice = "1"
         
         if choice == "1":
             success = runner.run_all_tests()
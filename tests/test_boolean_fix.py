@@ -4,11 +4,7 @@ Test script to verify the boolean condition fix
 """
 
 import pandas as pd
-import sys
-import os
-
-# Add the project root to the path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import io
 
 from components.sql_query_builder import SQLQueryBuilderComponent
 from utils.data_processing import DataProcessor
@@ -22,12 +18,16 @@ def test_boolean_fix():
     with open('sample_data/test_data_with_issues.csv', 'rb') as f:
         class MockUploadedFile:
             def __init__(self, content):
-                self.content = content
+                # Back the mock with a BytesIO like Streamlit's UploadedFile
+                self.content = io.BytesIO(content)
                 self.name = 'test_data_with_issues.csv'
                 self.size = len(content)
             
-            def read(self):
-                return self.content
+            def read(self, size=-1):
+                return self.content.read(size)
+            
+            def seek(self, offset, whence=0):
+                return self.content.seek(offset, whence)
         
         mock_file = MockUploadedFile(f.read())
     
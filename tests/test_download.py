@@ -4,36 +4,87 @@ Test script for data profiling download functionality
 """
 
 import pandas as pd
-import sys
+import numpy as np
+import pytest
+import json
 import os
-
-# Add the project root to the path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from concurrent.futures import ThreadPoolExecutor
 
 from utils.data_processing import DataProcessor
 
-def test_download_functionality():
-    """Test the data profiling download functionality"""
+def build_sample_data():
+    """Build the 1000-row sample dataset used by the download test"""
+    ids = np.arange(1, 1001, dtype=np.int32)
+    id_strings = ids.astype(str)
+    
+    # Ages and emails are filled as arrays so missing values can be set by slice;
+    # numeric columns use the narrowest dtype that holds them (ages need NaN)
+    ages = (20 + ids % 50).astype(np.float32)
+    ages[50:60] = np.nan
+    emails = np.char.add(np.char.add('user', id_strings), '@example.com').astype(object)
+    emails[100:110] = None
     
-    # Create a sample dataset
-    print("Creating sample dataset...")
     sample_data = {
-        'id': range(1, 1001),
-        'name': [f'User_{i}' for i in range(1, 1001)],
-        'age': [20 + (i % 50) for i in range(1, 1001)],
-        'email': [f'user{i}@example.com' for i in range(1, 1001)],
-        'active': [True if i % 2 == 0 else False for i in range(1, 1001)],
-        'score': [75.5 + (i % 25) for i in range(1, 1001)],
+        'id': ids,
+        'name': np.char.add('User_', id_strings),
+        'age': ages,
+        'email': emails,
+        'active': ids % 2 == 0,
+        'score': (75.5 + ids % 25).astype(np.float32),
         'created_date': pd.date_range('2023-01-01', periods=1000, freq='D')
     }
     
-    # Add some missing values
-    for i in range(50, 60):
-        sample_data['age'][i] = None
-    for i in range(100, 110):
-        sample_data['email'][i] = None
+    return pd.DataFrame(sample_data)
+
+@pytest.fixture(scope='session')
+def sample_df():
+    """The download sample dataset, built once per test session"""
+    return build_sample_data()
+
+def check_download_content(content, format_type):
+    """Assert that a generated profile download looks like its format"""
+    if format_type == 'json':
+        parsed = json.loads(content)
+        assert parsed['profile']['basic_info']['rows'] == 1000
+    elif format_type == 'excel':
+        # xlsx files are zip archives
+        assert content[:2] == b'PK'
+    elif format_type == 'html':
+        assert b'<table' in content
+    elif format_type == 'csv':
+        assert content.splitlines()[0] == b'Metric,Value'
+
+def generate_download_format(processor, df, profile, format_type):
+    """Generate one download format, saving it to file only when artifacts are kept"""
+    content = processor.generate_downloadable_profile(df, profile, format_type)
+    if not content:
+        return content, None
     
-    df = pd.DataFrame(sample_data)
+    # Check the content in memory; disk copies are only for manual inspection
+    check_download_content(content, format_type)
+    if not os.environ.get('KEEP_TEST_ARTIFACTS'):
+        return content, None
+    
+    # Map format types to proper file extensions
+    file_extensions = {
+        'json': 'json',
+        'excel': 'xlsx',
+        'html': 'html',
+        'csv': 'csv'
+    }
+    file_extension = file_extensions.get(format_type, format_type)
+    filename = f"test_profile.{file_extension}"
+    with open(filename, 'wb') as f:
+        f.write(content)
+    return content, filename
+
+@pytest.mark.cpu_heavy
+def test_download_functionality(sample_df):
+    """Test the data profiling download functionality"""
+    
+    # Create a sample dataset
+    print("Creating sample dataset...")
+    df = sample_df
     
     # Generate profile
     print("Generating data profile...")
@@ -46,38 +97,33 @@ def test_download_functionality():
     
     print("Profile generated successfully!")
     
-    # Test each download format
+    # Test each download format; the writers are independent, so run them concurrently
     formats = ['json', 'excel', 'html', 'csv']
     
-    for format_type in formats:
-        print(f"\nTesting {format_type.upper()} format...")
-        try:
-            content = processor.generate_downloadable_profile(df, profile, format_type)
-            if content:
-                print(f"{format_type.upper()} format generated successfully!")
-                print(f"   Size: {len(content)} bytes")
-                
-                # Save to file for inspection
-                # Map format types to proper file extensions
-                file_extensions = {
-                    'json': 'json',
-                    'excel': 'xlsx',
-                    'html': 'html',
-                    'csv': 'csv'
-                }
-                file_extension = file_extensions.get(format_type, format_type)
-                filename = f"test_profile.{file_extension}"
-                with open(filename, 'wb') as f:
-                    f.write(content)
-                print(f"   Saved to: {filename}")
-            else:
-                print(f"Failed to generate {format_type.upper()} format!")
-                return False
-        except Exception as e:
-            print(f"Error generating {format_type.upper()} format: {str(e)}")
+    with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+        futures = {
+            format_type: executor.submit(generate_download_format, processor, df, profile, format_type)
+            for format_type in formats
+        }
+        
+        for format_type, future in futures.items():
+            print(f"\nTesting {format_type.upper()} format...")
+            try:
+                content, filename = future.result()
+                if content:
+                    print(f"{format_type.upper()} format generated successfully!")
+                    print(f"   Size: {len(content)} bytes")
+                    if filename:
+                        print(f"   Saved to: {filename}")
+                else:
+                    print(f"Failed to generate {format_type.upper()} format!")
+                    return False
+            except Exception as e:
+                print(f"Error generating {format_type.upper()} format: {str(e)}")
+                raise
     
     print("\nDownload functionality test completed!")
     return True
 
 if __name__ == "__main__":
-    test_download_functionality()
+    test_download_functionality(build_sample_data())
@@ -5,12 +5,20 @@ Run this to test the OpenAI integration without the full Streamlit app
 
 import os
 import pandas as pd
+import numpy as np
+import pytest
 from dotenv import load_dotenv
 from components.openai_sql_generator import OpenAISQLGenerator
 
 # Load environment variables
 load_dotenv()
 
+# Live API tests only run when a key is configured
+pytestmark = [
+    pytest.mark.slow_network,
+    pytest.mark.skipif(not os.getenv('OPENAI_API_KEY'), reason='no OPENAI_API_KEY'),
+]
+
 def test_openai_integration():
     """Test the OpenAI SQL generator"""
     print("Testing OpenAI SQL Generator Integration...")
@@ -27,10 +35,10 @@ def test_openai_integration():
     
     # Create test data
     test_data = pd.DataFrame({
-        'name': ['John Doe', 'Jane Smith', None, 'Bob Johnson'],
-        'email': ['john@example.com', 'invalid-email', 'jane@test.com', None],
-        'age': [25, 30, 35, -5],
-        'active': [True, False, True, False]
+        'name': pd.array(['John Doe', 'Jane Smith', None, 'Bob Johnson'], dtype='string'),
+        'email': pd.array(['john@example.com', 'invalid-email', 'jane@test.com', None], dtype='string'),
+        'age': np.array([25, 30, 35, -5], dtype=np.int64),
+        'active': np.array([True, False, True, False], dtype=bool)
     })
     
     print(f"Test data created with shape: {test_data.shape}")
@@ -54,7 +62,7 @@ def test_openai_integration():
     sql_query = generator.generate_sql_query(
         description=description,
         data_columns=list(test_data.columns),
-        data_types={col: str(dtype) for col, dtype in test_data.dtypes.items()},
+        data_types=test_data.dtypes.astype(str).to_dict(),
         sample_data=test_data
     )
     
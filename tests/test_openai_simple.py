@@ -3,13 +3,133 @@ Simple test for OpenAI SQL Generator without Streamlit dependencies
 """
 
 import os
+import json
+import asyncio
+import hashlib
+import numpy as np
 import pandas as pd
+import pytest
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 # Load environment variables
 load_dotenv()
 
+# Live API tests only run when a key is configured
+pytestmark = [
+    pytest.mark.slow_network,
+    pytest.mark.skipif(not os.getenv('OPENAI_API_KEY'), reason='no OPENAI_API_KEY'),
+]
+
+# Responses are cached by prompt and model so identical reruns skip the API call
+RESPONSE_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'gewrapper_openai.json')
+
+def _cache_key(request_params):
+    """Cache key for a request: hash of the user prompt and model"""
+    prompt = request_params['messages'][-1]['content']
+    return hashlib.sha256((prompt + request_params['model']).encode('utf-8')).hexdigest()
+
+def _load_response_cache():
+    """Load cached responses, starting empty if the cache is missing or unreadable"""
+    try:
+        with open(RESPONSE_CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_response_cache(cache):
+    """Write cached responses back to disk"""
+    os.makedirs(os.path.dirname(RESPONSE_CACHE_PATH), exist_ok=True)
+    with open(RESPONSE_CACHE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
+
+# Prompts that miss the exact cache are matched by embedding similarity, so
+# reworded prompts can still reuse an earlier response
+SEMANTIC_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'gewrapper_openai_semantic')
+SEMANTIC_EMBEDDING_MODEL = "text-embedding-3-small"
+SEMANTIC_THRESHOLD = 0.93
+
+def _load_semantic_cache():
+    """Load stored prompt embeddings and their entries, or (None, []) if there are none"""
+    try:
+        embeddings = np.load(os.path.join(SEMANTIC_CACHE_DIR, 'embs.npy'))
+        with open(os.path.join(SEMANTIC_CACHE_DIR, 'responses.json'), 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return None, []
+    # An interrupted save can leave the two files out of step; treat that as no cache
+    if embeddings.ndim != 2 or len(entries) != embeddings.shape[0]:
+        return None, []
+    return embeddings, entries
+
+def _save_semantic_cache(embeddings, entries):
+    """Write prompt embeddings and their entries back to disk"""
+    os.makedirs(SEMANTIC_CACHE_DIR, exist_ok=True)
+    np.save(os.path.join(SEMANTIC_CACHE_DIR, 'embs.npy'), embeddings)
+    with open(os.path.join(SEMANTIC_CACHE_DIR, 'responses.json'), 'w', encoding='utf-8') as f:
+        json.dump(entries, f)
+
+def _semantic_match(embeddings, entries, embedding, model):
+    """Return the cached response closest to embedding for the same model, if close enough"""
+    if embeddings is None or embeddings.shape[1] != embedding.shape[0]:
+        return None
+    scores = np.where([entry['model'] == model for entry in entries], embeddings @ embedding, -1.0)
+    best = int(scores.argmax())
+    return entries[best]['response'] if scores[best] > SEMANTIC_THRESHOLD else None
+
+async def _embed(client, text):
+    """Unit-normalised embedding of text"""
+    response = await client.embeddings.create(model=SEMANTIC_EMBEDDING_MODEL, input=text)
+    embedding = np.asarray(response.data[0].embedding, dtype=np.float32)
+    return embedding / np.linalg.norm(embedding)
+
+async def _run(client, request_params):
+    """Send one chat completion request and return the stripped response text"""
+    response = await client.chat.completions.create(**request_params)
+    return response.choices[0].message.content.strip()
+
+async def _run_all(api_key, requests):
+    """Send all uncached requests concurrently on a single async client"""
+    cache = _load_response_cache()
+    keys = [_cache_key(request_params) for request_params in requests]
+    missing = [(key, request_params) for key, request_params in zip(keys, requests) if key not in cache]
+    
+    if not missing:
+        print("Using cached OpenAI responses")
+        return [cache[key] for key in keys]
+    
+    client = AsyncOpenAI(api_key=api_key)
+    print("OpenAI client initialized")
+    
+    # Look up reworded prompts in the semantic cache before calling the model
+    embeddings, entries = _load_semantic_cache()
+    prompt_embeddings = await asyncio.gather(
+        *(_embed(client, request_params['messages'][-1]['content']) for _, request_params in missing)
+    )
+    to_send = []
+    for (key, request_params), embedding in zip(missing, prompt_embeddings):
+        match = _semantic_match(embeddings, entries, embedding, request_params['model'])
+        if match is not None:
+            print("Using semantically cached OpenAI response")
+            cache[key] = match
+        else:
+            to_send.append((key, request_params, embedding))
+    
+    if to_send:
+        responses = await asyncio.gather(*(_run(client, request_params) for _, request_params, _ in to_send))
+        new_embeddings = np.stack([embedding for _, _, embedding in to_send])
+        for (key, request_params, _), response in zip(to_send, responses):
+            cache[key] = response
+            entries.append({'model': request_params['model'], 'response': response})
+        if embeddings is None or embeddings.shape[1] != new_embeddings.shape[1]:
+            embeddings, entries = new_embeddings, entries[-len(to_send):]
+        else:
+            embeddings = np.vstack([embeddings, new_embeddings])
+        _save_semantic_cache(embeddings, entries)
+    
+    _save_response_cache(cache)
+    return [cache[key] for key in keys]
+
 def test_openai_direct():
     """Test OpenAI API directly"""
     print("Testing OpenAI API directly...")
@@ -24,10 +144,6 @@ def test_openai_direct():
     print(f"API key found (first 10 chars): {api_key[:10]}...")
     
     try:
-        # Initialize client
-        client = OpenAI(api_key=api_key)
-        print("OpenAI client initialized")
-        
         # Test a simple request with proper parameters
         description = "prospect__list must be unique"
         columns = ["prospect__list", "name", "email", "status"]
@@ -70,9 +186,8 @@ WHERE [condition that identifies violations]
         }
         
         print(f"Making request to {model}...")
-        response = client.chat.completions.create(**request_params)
-        
-        sql_query = response.choices[0].message.content.strip()
+        # Requests go through gather so further prompts can be added without rewriting
+        sql_query = asyncio.run(_run_all(api_key, [request_params]))[0]
         
         # Clean up the response
         if sql_query.startswith("```sql"):
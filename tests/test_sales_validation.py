@@ -4,30 +4,27 @@ Test script for Sales salary validation rule
 """
 
 import pandas as pd
-import sys
-import os
-
-# Add the project root to the path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from components.custom_sql_expectations import CustomSQLExpectation
 
-def test_sales_salary_validation():
+def test_sales_salary_validation(issue_data, custom_sql, issue_sql):
     """Test the Sales salary validation rule"""
     
-    # Load the test data
-    data = pd.read_csv('sample_data/test_data_with_issues.csv')
+    # The test data is loaded once per session by the issue_data fixture
+    data = issue_data
     print(f"Loaded data with {len(data)} rows")
     print(f"Columns: {list(data.columns)}")
     
     # Show Sales employees
     sales_employees = data[data['department'] == 'Sales']
     print(f"\nSales employees ({len(sales_employees)}):")
-    for _, row in sales_employees.iterrows():
-        print(f"  - {row['name']}: active={row['active']}, salary={row['salary']}")
-    
-    # Create the custom SQL expectation
-    custom_sql = CustomSQLExpectation()
+    if not sales_employees.empty:
+        print('\n'.join(
+            f"  - {name}: active={active}, salary={salary}"
+            for name, active, salary in zip(
+                sales_employees['name'].values, sales_employees['active'].values, sales_employees['salary'].values
+            )
+        ))
     
     # Define the validation rule
     sql_query = """
@@ -53,7 +50,7 @@ def test_sales_salary_validation():
     
     # Test the query execution
     try:
-        result_df = custom_sql.execute_sql_query(data, sql_query)
+        result_df = issue_sql(sql_query)
         print(f"\nQuery execution result:")
         print(result_df)
         
@@ -73,8 +70,11 @@ def test_sales_salary_validation():
                     (data['salary'] < 40000)
                 ]
                 print("\nViolating records:")
-                for _, row in violating_records.iterrows():
-                    print(f"  - {row['name']}: salary={row['salary']}")
+                if not violating_records.empty:
+                    print('\n'.join(
+                        f"  - {name}: salary={salary}"
+                        for name, salary in zip(violating_records['name'].values, violating_records['salary'].values)
+                    ))
         else:
             print("Query returned no results or unexpected format")
             
@@ -97,4 +97,6 @@ def test_sales_salary_validation():
         print(f"Error in validation: {str(e)}")
 
 if __name__ == "__main__":
-    test_sales_salary_validation()
+    data = pd.read_csv('sample_data/test_data_with_issues.csv')
+    custom_sql = CustomSQLExpectation()
+    test_sales_salary_validation(data, custom_sql, lambda sql_query: custom_sql.execute_sql_query(data, sql_query))
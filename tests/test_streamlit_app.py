@@ -4,37 +4,59 @@ Test script to simulate Streamlit app environment and test SQL query execution
 """
 
 import pandas as pd
-import sys
-import os
-
-# Add the project root to the path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import pytest
+import io
 
 from utils.data_processing import DataProcessor
 from components.custom_sql_expectations import CustomSQLExpectation
 
+# SQL active conditions and the value each one compares against
+ACTIVE_CONDITIONS = [
+    ("active = 1", 1),
+    ("active = True", True),
+    ("active = 'true'", 'true'),
+    ("active = 0", 0),
+    ("active = False", False),
+    ("active = 'false'", 'false')
+]
+
+def load_app_data():
+    """Load the issues sample through DataProcessor the way the app loads an upload"""
+    # A BytesIO with the upload's name and size stands in for the uploaded file
+    with open('sample_data/test_data_with_issues.csv', 'rb') as f:
+        mock_file = io.BytesIO(f.read())
+    mock_file.name = 'test_data_with_issues.csv'
+    mock_file.size = mock_file.getbuffer().nbytes
+    return DataProcessor.load_file(mock_file)
+
+@pytest.fixture(scope='module')
+def app_data():
+    """Issues sample loaded once for this module"""
+    return load_app_data()
+
+@pytest.mark.parametrize('condition, active_value', ACTIVE_CONDITIONS)
+def test_active_condition(condition, active_value, app_data, custom_sql):
+    """The SQL and pandas Sales violation counts agree for each active condition"""
+    test_query = f"""
+    SELECT COUNT(*) as violation_count
+    FROM {{table_name}}
+    WHERE department = 'Sales' AND {condition} AND salary < 40000
+    """
+    result = custom_sql.execute_sql_query(app_data, test_query)
+    assert not result.empty and 'violation_count' in result.columns
+    
+    base = (app_data['department'].values == 'Sales') & (app_data['salary'].values < 40000)
+    active_mask = app_data['active'].eq(active_value).to_numpy()
+    assert result['violation_count'].iloc[0] == int((base & active_mask).sum())
+
 def test_streamlit_app_simulation():
     """Simulate the Streamlit app environment and test SQL query execution"""
     
     print("=== Testing Streamlit App Simulation ===")
     
-    # Simulate file upload like in the app
-    with open('sample_data/test_data_with_issues.csv', 'rb') as f:
-        # Create a mock uploaded file object
-        class MockUploadedFile:
-            def __init__(self, content):
-                self.content = content
-                self.name = 'test_data_with_issues.csv'
-                self.size = len(content)
-            
-            def read(self):
-                return self.content
-        
-        mock_file = MockUploadedFile(f.read())
-    
     # Load data using the app's DataProcessor
     print("\n1. Loading data with app's DataProcessor:")
-    data = DataProcessor.load_file(mock_file)
+    data = load_app_data()
     print(f"   Data shape: {data.shape}")
     print(f"   Data types: {dict(data.dtypes)}")
     print(f"   Active column unique values: {data['active'].unique()}")
@@ -42,8 +64,13 @@ def test_streamlit_app_simulation():
     # Show Sales employees
     sales_employees = data[data['department'] == 'Sales']
     print(f"\n2. Sales employees:")
-    for _, row in sales_employees.iterrows():
-        print(f"   - {row['name']}: active={row['active']}, salary={row['salary']}")
+    if not sales_employees.empty:
+        print('\n'.join(
+            f"   - {name}: active={active}, salary={salary}"
+            for name, active, salary in zip(
+                sales_employees['name'].values, sales_employees['active'].values, sales_employees['salary'].values
+            )
+        ))
     
     # Test the exact SQL query from the image
     print(f"\n3. Testing the exact SQL query from the image:")
@@ -70,57 +97,27 @@ def test_streamlit_app_simulation():
     # Test with different active conditions
     print(f"\n4. Testing different active conditions:")
     
-    conditions = [
-        ("active = 1", "active = 1"),
-        ("active = True", "active = True"),
-        ("active = 'true'", "active = 'true'"),
-        ("active = 0", "active = 0"),
-        ("active = False", "active = False"),
-        ("active = 'false'", "active = 'false'")
-    ]
+    # The department and salary filters are shared by every condition, so compute them
+    # once and only vary the active mask; test_active_condition checks these against SQL
+    base = (data['department'].values == 'Sales') & (data['salary'].values < 40000)
     
-    for condition_name, condition in conditions:
-        test_query = f"""
-        SELECT COUNT(*) as violation_count
-        FROM {{table_name}}
-        WHERE department = 'Sales' AND {condition} AND salary < 40000
-        """
-        try:
-            result = custom_sql.execute_sql_query(data, test_query)
-            if not result.empty and 'violation_count' in result.columns:
-                violation_count = result['violation_count'].iloc[0]
-                print(f"   {condition_name}: {violation_count}")
-            else:
-                print(f"   {condition_name}: No result")
-        except Exception as e:
-            print(f"   {condition_name}: Error - {str(e)}")
+    for condition_name, active_value in ACTIVE_CONDITIONS:
+        active_mask = data['active'].eq(active_value).to_numpy()
+        print(f"   {condition_name}: {int((base & active_mask).sum())}")
     
     # Test manual pandas filtering for comparison
     print(f"\n5. Manual pandas filtering for comparison:")
     
-    # Test with active = 1 (integer)
-    manual_result_1 = data[
-        (data['department'] == 'Sales') & 
-        (data['active'] == 1) & 
-        (data['salary'] < 40000)
-    ]
-    print(f"   Manual filter with active=1: {len(manual_result_1)} rows")
-    
-    # Test with active = True (boolean)
-    manual_result_2 = data[
-        (data['department'] == 'Sales') & 
-        (data['active'] == True) & 
-        (data['salary'] < 40000)
-    ]
-    print(f"   Manual filter with active=True: {len(manual_result_2)} rows")
+    # The department and salary filters don't depend on the active value, so build them once
+    sales_low_salary = ((data['department'] == 'Sales') & (data['salary'] < 40000)).to_numpy(
+        dtype=bool, na_value=False
+    )
     
-    # Test with active = 'true' (string)
-    manual_result_3 = data[
-        (data['department'] == 'Sales') & 
-        (data['active'] == 'true') & 
-        (data['salary'] < 40000)
-    ]
-    print(f"   Manual filter with active='true': {len(manual_result_3)} rows")
+    # Test with active = 1 (integer), True (boolean) and 'true' (string)
+    for label, active_value in [("active=1", 1), ("active=True", True), ("active='true'", 'true')]:
+        active_mask = data['active'].eq(active_value).to_numpy(dtype=bool, na_value=False)
+        violation_count = int((sales_low_salary & active_mask).sum())
+        print(f"   Manual filter with {label}: {violation_count} rows")
 
 if __name__ == "__main__":
     test_streamlit_app_simulation()
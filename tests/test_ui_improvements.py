@@ -3,12 +3,15 @@
 Test script to verify UI improvements in the expectation builder component
 """
 
-import sys
+import io
 import os
+import sys
 import pandas as pd
+import numpy as np
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Direct script runs need the project root on the path; pytest gets it from conftest.py
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from components.expectation_builder import ExpectationBuilderComponent
 
@@ -17,11 +20,11 @@ def test_expectation_builder_ui():
     
     # Create sample data
     data = pd.DataFrame({
-        'name': ['John', 'Jane', 'Bob', None],
-        'age': [25, 30, 35, 40],
-        'email': ['john@example.com', 'jane@example.com', 'invalid-email', None],
-        'salary': [50000, 60000, 70000, 80000],
-        'active': [True, False, True, False]
+        'name': pd.array(['John', 'Jane', 'Bob', None], dtype='string'),
+        'age': np.array([25, 30, 35, 40], dtype=np.int64),
+        'email': pd.array(['john@example.com', 'jane@example.com', 'invalid-email', None], dtype='string'),
+        'salary': np.array([50000, 60000, 70000, 80000], dtype=np.int64),
+        'active': np.array([True, False, True, False], dtype=bool)
     })
     
     print("Sample data created successfully")
@@ -70,19 +73,9 @@ def test_expectation_builder_ui():
             ]
         }
         
-        # Simulate file upload object
-        class MockUploadedFile:
-            def __init__(self, data):
-                self.data = json.dumps(data).encode()
-                self.name = "test_suite.json"
-            
-            def seek(self, pos):
-                pass
-            
-            def read(self):
-                return self.data.decode()
-        
-        mock_file = MockUploadedFile(mock_import_data)
+        # Simulate file upload object; json.loads reads the encoded bytes directly
+        mock_file = io.BytesIO(json.dumps(mock_import_data).encode('utf-8'))
+        mock_file.name = "test_suite.json"
         builder._process_import(mock_file)
         print("Import processing works correctly")
     except Exception as e:
@@ -4,24 +4,16 @@ Test script to verify the correct Sales salary validation
 """
 
 import pandas as pd
-import sys
-import os
-
-# Add the project root to the path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from components.custom_sql_expectations import CustomSQLExpectation
 
-def test_correct_validation():
+def test_correct_validation(issue_data, custom_sql, issue_sql):
     """Test the correct Sales salary validation"""
     
-    # Load the test data
-    data = pd.read_csv('sample_data/test_data_with_issues.csv')
+    # The test data is loaded once per session by the issue_data fixture
+    data = issue_data
     print(f"Loaded data with {len(data)} rows")
     
-    # Create the custom SQL expectation
-    custom_sql = CustomSQLExpectation()
-    
     # CORRECT SQL query (using active = 1 for boolean True)
     sql_query = """
     SELECT COUNT(*) as violation_count 
@@ -34,7 +26,7 @@ def test_correct_validation():
     
     # Test the query execution
     try:
-        result_df = custom_sql.execute_sql_query(data, sql_query)
+        result_df = issue_sql(sql_query)
         print(f"\nQuery execution result:")
         print(result_df)
         
@@ -81,4 +73,6 @@ def test_correct_validation():
         print(f"❌ Error in validation: {str(e)}")
 
 if __name__ == "__main__":
-    test_correct_validation()
+    data = pd.read_csv('sample_data/test_data_with_issues.csv')
+    custom_sql = CustomSQLExpectation()
+    test_correct_validation(data, custom_sql, lambda sql_query: custom_sql.execute_sql_query(data, sql_query))
@@ -3,16 +3,64 @@ import numpy as np
 import json
 from typing import Dict, List, Any, Optional, Tuple
 import streamlit as st
-from io import StringIO, BytesIO
+from io import BytesIO
 import base64
 from datetime import datetime
 import html
 import uuid
+import codecs
+import csv
+import os
+import re
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+
+# Smallest-first integer dtypes tried when suggesting a downcast
+UNSIGNED_INT_TYPES = [(name, np.iinfo(name)) for name in ('uint8', 'uint16', 'uint32', 'uint64')]
+SIGNED_INT_TYPES = [(name, np.iinfo(name)) for name in ('int8', 'int16', 'int32', 'int64')]
 
 class DataProcessor:
     """Utility class for data processing operations"""
     
     ROW_UUID_COL = '__row_uuid'
+    
+    # Lower-cased strings treated as booleans, and the value each one converts to
+    BOOL_MAP = {
+        'true': True, 'false': False,
+        '1': True, '0': False,
+        'yes': True, 'no': False
+    }
+    BOOL_VALUES = frozenset(BOOL_MAP)
+    
+    # Bytes read from the head of an upload when sniffing its encoding
+    ENCODING_SAMPLE_BYTES = 64 * 1024
+    
+    # Frames with more cells than this get a sampled, rather than exact, deep memory size
+    DEEP_MEMORY_CELL_LIMIT = 10_000_000
+    MEMORY_SAMPLE_ROWS = 10_000
+    
+    # Text columns with more distinct values than this skip the most-common-values count
+    MOST_COMMON_MAX_UNIQUE = 10_000
+    
+    # Cells reduced together per column batch of a dtype group in _frame_numeric_stats
+    NUMERIC_STATS_BATCH_CELLS = 1_000_000
+    
+    # Column count from which get_data_profile profiles columns on a thread pool
+    PARALLEL_PROFILE_MIN_COLUMNS = 32
+    PARALLEL_PROFILE_MAX_WORKERS = 8
+    
+    # Characters stripped from column names to keep them SQL-friendly
+    INVALID_COLUMN_CHARS = re.compile(r'[^A-Za-z0-9_]')
+    
+    # Sampled values parsed first when guessing whether a text column holds dates
+    DATE_PROBE_ROWS = 20
+    
+    # Leading rows counted before a full distinct-value count when suggesting 'category'
+    CATEGORY_PROBE_ROWS = 10_000
+    
+    # Leading rows checked before a full distinct-value scan when looking for boolean columns
+    BOOLEAN_PROBE_ROWS = 1000
 
     @staticmethod
     def _ensure_row_uuid(df: pd.DataFrame) -> pd.DataFrame:
@@ -26,13 +74,82 @@ class DataProcessor:
             if df is None:
                 return df
             if DataProcessor.ROW_UUID_COL not in df.columns:
-                df = df.copy()
+                # Adding a column leaves the caller's frame alone, so the data need not be copied
+                df = df.copy(deep=False)
                 df[DataProcessor.ROW_UUID_COL] = [str(uuid.uuid4()) for _ in range(len(df))]
             return df
         except Exception:
             # Fail-safe: never block load on uuid; return original df
             return df
 
+    @staticmethod
+    def _detect_encoding(content: bytes) -> str:
+        """Guess the text encoding of an uploaded file from its first bytes.
+
+        UTF-8 is used when the sample decodes cleanly, otherwise latin-1, which
+        is what the previous full-decode retries ended up with as well.
+        """
+        sample = content[:DataProcessor.ENCODING_SAMPLE_BYTES]
+        try:
+            # Incremental decode tolerates a multi-byte character cut at the sample edge
+            codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            return 'latin-1'
+
+    @staticmethod
+    def _read_csv_bytes(content: bytes, encoding: str) -> pd.DataFrame:
+        """Parse CSV bytes, preferring pyarrow's multi-threaded parser.
+
+        Falls back to the python engine with delimiter sniffing whenever pyarrow is
+        unavailable or would read the file differently from it.
+        """
+        try:
+            df = DataProcessor._read_csv_pyarrow(content, encoding)
+            if df is not None:
+                return df
+        except Exception:
+            pass
+        return pd.read_csv(BytesIO(content), sep=None, engine='python', encoding=encoding)
+
+    @staticmethod
+    def _read_csv_pyarrow(content: bytes, encoding: str) -> Optional[pd.DataFrame]:
+        """Read CSV bytes with the pyarrow engine, or return None if the python engine is needed"""
+        import pyarrow  # noqa: F401 - the pyarrow engine needs it installed
+        
+        # Sniff the dialect from the header line, as the python engine does with sep=None
+        head = content[:DataProcessor.ENCODING_SAMPLE_BYTES].decode(encoding, errors='ignore')
+        first_line = head.splitlines()[0] if head else ''
+        dialect = csv.Sniffer().sniff(first_line)
+        header = next(csv.reader([first_line], dialect))
+        # pyarrow neither skips initial spaces nor renames repeated headers
+        if dialect.skipinitialspace or dialect.quotechar != '"' or len(set(header)) != len(header):
+            return None
+        
+        df = pd.read_csv(BytesIO(content), sep=dialect.delimiter, encoding=encoding, engine='pyarrow')
+        
+        object_kinds = {
+            col: pd.api.types.infer_dtype(df[col], skipna=True)
+            for col in df.columns if df[col].dtype == object
+        }
+        # Arrow hands back undecodable text as bytes; let the python engine raise for it
+        if 'bytes' in object_kinds.values():
+            return None
+        
+        # Arrow also parses ISO dates and timestamps, which the python engine keeps as text
+        date_cols = [
+            col for col in df.columns
+            if DataProcessor._dtype_kind(df[col].dtype) == 'datetime' or object_kinds.get(col) in ('date', 'datetime')
+        ]
+        if date_cols:
+            # pyarrow casts dtype=str after parsing, so re-read these with the C engine
+            date_text = pd.read_csv(
+                BytesIO(content), sep=dialect.delimiter, encoding=encoding,
+                usecols=date_cols, dtype=str
+            )
+            df[date_cols] = date_text[date_cols]
+        return df
+
     @staticmethod
     def load_file(uploaded_file) -> Optional[pd.DataFrame]:
         """Load uploaded file into pandas DataFrame"""
@@ -40,40 +157,24 @@ class DataProcessor:
             file_extension = uploaded_file.name.split('.')[-1].lower()
             
             if file_extension == 'csv':
-                # Try different encodings and separators
                 content = uploaded_file.read()
                 
-                # Try UTF-8 first
+                # Sniff the encoding from the head of the file and parse the bytes directly
+                encoding = DataProcessor._detect_encoding(content)
                 try:
-                    df = pd.read_csv(StringIO(content.decode('utf-8')), sep=None, engine='python')
-                    # Convert string booleans to actual booleans
-                    df = DataProcessor._convert_string_booleans(df)
-                    df = DataProcessor._ensure_row_uuid(df)
-                    # Clean column names for SQL compatibility
-                    df = DataProcessor.clean_column_names(df)
-                    return df
+                    df = DataProcessor._read_csv_bytes(content, encoding)
                 except UnicodeDecodeError:
-                    # Try other encodings
-                    for encoding in ['latin-1', 'iso-8859-1', 'cp1252']:
-                        try:
-                            df = pd.read_csv(StringIO(content.decode(encoding)), sep=None, engine='python')
-                            # Convert string booleans to actual booleans
-                            df = DataProcessor._convert_string_booleans(df)
-                            df = DataProcessor._ensure_row_uuid(df)
-                            # Clean column names for SQL compatibility
-                            df = DataProcessor.clean_column_names(df)
-                            return df
-                        except:
-                            continue
-                    
-                    # If all encodings fail, try with errors='ignore'
-                    df = pd.read_csv(StringIO(content.decode('utf-8', errors='ignore')), sep=None, engine='python')
-                    # Convert string booleans to actual booleans
-                    df = DataProcessor._convert_string_booleans(df)
-                    df = DataProcessor._ensure_row_uuid(df)
-                    # Clean column names for SQL compatibility
-                    df = DataProcessor.clean_column_names(df)
-                    return df
+                    # UTF-8 head but not UTF-8 further in
+                    df = DataProcessor._read_csv_bytes(content, 'latin-1')
+                # The raw bytes are not needed once parsed; free them before the frame is post-processed
+                del content
+                
+                # Convert string booleans to actual booleans
+                df = DataProcessor._convert_string_booleans(df)
+                df = DataProcessor._ensure_row_uuid(df)
+                # Clean column names for SQL compatibility
+                df = DataProcessor.clean_column_names(df)
+                return df
                     
             elif file_extension in ['xlsx', 'xls']:
                 df = pd.read_excel(uploaded_file, engine='openpyxl')
@@ -85,11 +186,25 @@ class DataProcessor:
             elif file_extension == 'json':
                 # Read as JSON
                 content = uploaded_file.read()
-                json_data = json.loads(content.decode('utf-8'))
+                # json.loads decodes bytes itself, so no decoded str copy of the file is made;
+                # the raw bytes are released before the frame is built
+                try:
+                    json_data = json.loads(content)
+                except json.JSONDecodeError as e:
+                    if e.msg != 'Extra data':
+                        raise
+                    # Newline-delimited JSON: one record per line, handled like a list of records
+                    json_data = [json.loads(line) for line in content.splitlines() if line.strip()]
+                del content
                 
                 # Handle different JSON structures
                 if isinstance(json_data, list):
-                    df = pd.json_normalize(json_data)
+                    # Flat records need no flattening, and the plain constructor is several times faster
+                    is_flat = all(
+                        isinstance(record, dict) and not any(isinstance(v, dict) for v in record.values())
+                        for record in json_data
+                    )
+                    df = pd.DataFrame(json_data) if is_flat else pd.json_normalize(json_data)
                 elif isinstance(json_data, dict):
                     # Check if it's a dictionary with arrays
                     if all(isinstance(v, list) for v in json_data.values()):
@@ -106,7 +221,8 @@ class DataProcessor:
                 return df
                 
             elif file_extension == 'parquet':
-                df = pd.read_parquet(uploaded_file)
+                # pyarrow reads the column chunks on multiple threads; it is already a requirement
+                df = pd.read_parquet(uploaded_file, engine='pyarrow')
                 df = DataProcessor._ensure_row_uuid(df)
                 # Clean column names for SQL compatibility
                 df = DataProcessor.clean_column_names(df)
@@ -121,106 +237,81 @@ class DataProcessor:
             return None
     
     @staticmethod
-    def get_data_profile(df: pd.DataFrame) -> Dict[str, Any]:
-        """Generate comprehensive data profile"""
+    def estimate_memory_usage(df: pd.DataFrame) -> int:
+        """Return the deep memory usage of a DataFrame in bytes.
+
+        Measuring object cells is a Python call per cell, so frames above
+        DEEP_MEMORY_CELL_LIMIT are measured on evenly spaced sample rows and scaled up.
+        """
+        rows = len(df)
+        if rows * len(df.columns) <= DataProcessor.DEEP_MEMORY_CELL_LIMIT or rows <= DataProcessor.MEMORY_SAMPLE_ROWS:
+            return df.memory_usage(deep=True).sum()
+        
+        # Kept a NumPy integer like the exact sum, so exports format both the same way
+        step = rows // DataProcessor.MEMORY_SAMPLE_ROWS
+        sample = df.iloc[::step]
+        return np.int64(sample.memory_usage(deep=True).sum() * rows / len(sample))
+    
+    @staticmethod
+    def _null_counts(df: pd.DataFrame) -> pd.Series:
+        """Missing values per column.
+
+        Frames above DEEP_MEMORY_CELL_LIMIT are counted column by column, so only one
+        column's null mask exists at a time instead of a full rows x columns boolean frame.
+        """
+        if len(df) * len(df.columns) <= DataProcessor.DEEP_MEMORY_CELL_LIMIT:
+            return df.isnull().sum()
+        return pd.Series(
+            [df.iloc[:, i].isna().sum() for i in range(len(df.columns))],
+            index=df.columns, dtype='int64'
+        )
+    
+    @staticmethod
+    def get_data_profile(df: pd.DataFrame, downcast: bool = False) -> Dict[str, Any]:
+        """Generate comprehensive data profile
+
+        downcast narrows integer columns to their smallest fitting type before the
+        numeric statistics; the reported values and dtypes are unchanged.
+        """
         try:
+            # Compute the null counts and duplicate count once and reuse them below
+            null_counts = DataProcessor._null_counts(df)
+            total_missing = null_counts.sum()
+            # Row hashing is skipped entirely for an empty frame
+            duplicate_rows = df.duplicated().sum() if len(df) else 0
+            
             profile = {
                 'basic_info': {
                     'rows': len(df),
                     'columns': len(df.columns),
-                    'memory_usage': df.memory_usage(deep=True).sum(),
+                    'memory_usage': DataProcessor.estimate_memory_usage(df),
                     'data_types': {str(k): v for k, v in df.dtypes.value_counts().to_dict().items()}
                 },
                 'column_info': {},
                 'missing_data': {
-                    'total_missing': df.isnull().sum().sum(),
-                    'missing_percentage': (df.isnull().sum().sum() / (len(df) * len(df.columns))) * 100,
-                    'columns_with_missing': df.isnull().sum()[df.isnull().sum() > 0].to_dict()
+                    'total_missing': total_missing,
+                    'missing_percentage': (total_missing / (len(df) * len(df.columns))) * 100,
+                    'columns_with_missing': null_counts[null_counts > 0].to_dict()
                 },
                 'duplicates': {
-                    'duplicate_rows': df.duplicated().sum(),
-                    'duplicate_percentage': (df.duplicated().sum() / len(df)) * 100
+                    'duplicate_rows': duplicate_rows,
+                    'duplicate_percentage': (duplicate_rows / len(df)) * 100 if len(df) else 0.0
                 }
             }
             
-            # Column-specific information
-            for col in df.columns:
-                try:
-                    col_info = {
-                        'dtype': str(df[col].dtype),
-                        'non_null_count': df[col].count(),
-                        'null_count': df[col].isnull().sum(),
-                        'null_percentage': (df[col].isnull().sum() / len(df)) * 100,
-                        'unique_count': df[col].nunique(),
-                        'unique_percentage': (df[col].nunique() / len(df)) * 100
-                    }
-                    
-                    # Numeric columns - handle potential boolean string columns
-                    if pd.api.types.is_numeric_dtype(df[col]):
-                        # Check if it's actually numeric and not boolean strings
-                        try:
-                            col_info.update({
-                                'mean': df[col].mean(),
-                                'median': df[col].median(),
-                                'std': df[col].std(),
-                                'min': df[col].min(),
-                                'max': df[col].max(),
-                                'q25': df[col].quantile(0.25),
-                                'q75': df[col].quantile(0.75)
-                            })
-                        except (TypeError, ValueError) as e:
-                            # Handle cases where numeric operations fail (e.g., boolean strings)
-                            col_info['numeric_stats_error'] = str(e)
-                    
-                    # Text columns
-                    elif pd.api.types.is_object_dtype(df[col]):
-                        try:
-                            col_info.update({
-                                'max_length': df[col].astype(str).str.len().max(),
-                                'min_length': df[col].astype(str).str.len().min(),
-                                'avg_length': df[col].astype(str).str.len().mean(),
-                                'most_common': df[col].value_counts().head().to_dict()
-                            })
-                        except Exception as e:
-                            col_info['text_stats_error'] = str(e)
-                    
-                    # Datetime columns
-                    elif pd.api.types.is_datetime64_any_dtype(df[col]):
-                        try:
-                            col_info.update({
-                                'earliest': df[col].min(),
-                                'latest': df[col].max(),
-                                'date_range_days': (df[col].max() - df[col].min()).days
-                            })
-                        except Exception as e:
-                            col_info['datetime_stats_error'] = str(e)
-                    
-                    # Boolean columns (including string booleans)
-                    elif str(df[col].dtype) == 'bool' or DataProcessor._is_boolean_column(df[col]):
-                        try:
-                            # Convert string booleans to actual booleans for analysis
-                            if pd.api.types.is_object_dtype(df[col]):
-                                bool_series = df[col].astype(str).str.lower().map({'true': True, 'false': False})
-                            else:
-                                bool_series = df[col].astype(bool)
-                            
-                            col_info.update({
-                                'true_count': bool_series.sum(),
-                                'false_count': (~bool_series).sum(),
-                                'true_percentage': (bool_series.sum() / len(bool_series)) * 100,
-                                'false_percentage': ((~bool_series).sum() / len(bool_series)) * 100
-                            })
-                        except Exception as e:
-                            col_info['boolean_stats_error'] = str(e)
-                    
-                    profile['column_info'][col] = col_info
-                    
-                except Exception as col_error:
-                    # If individual column processing fails, add error info
-                    profile['column_info'][col] = {
-                        'dtype': str(df[col].dtype),
-                        'processing_error': str(col_error)
-                    }
+            # Column-specific information; wide frames are profiled on a thread pool since
+            # pandas' hashing, sorting and reduction kernels release the GIL
+            numeric_stats = DataProcessor._frame_numeric_stats(df, downcast)
+            profile_column = partial(DataProcessor._profile_column, df, null_counts, numeric_stats)
+            if len(df.columns) >= DataProcessor.PARALLEL_PROFILE_MIN_COLUMNS:
+                workers = min(DataProcessor.PARALLEL_PROFILE_MAX_WORKERS, os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    column_infos = list(executor.map(profile_column, df.columns))
+            else:
+                column_infos = [profile_column(col) for col in df.columns]
+            
+            for col, col_info in zip(df.columns, column_infos):
+                profile['column_info'][col] = col_info
             
             return profile
             
@@ -228,65 +319,255 @@ class DataProcessor:
             st.error(f"Error generating data profile: {str(e)}")
             return {}
     
+    @staticmethod
+    def _frame_numeric_stats(df: pd.DataFrame, downcast: bool = False) -> Dict[Any, Dict[str, Any]]:
+        """Numeric profile stats for plain int/float columns, reduced per dtype group.
+
+        Each group is reduced in 2-D column batches of about NUMERIC_STATS_BATCH_CELLS
+        cells, so min, max and the quartiles are one call per batch while the copies taken
+        for the reductions stay small; grouping by dtype keeps int min/max as ints. Columns
+        left out (nullable, bool, or a batch that fails) are profiled one by one. With
+        downcast, integer batches are narrowed to the smallest type holding their range
+        before the mean, std and quartiles, which sweeps fewer bytes and gives the same values.
+        """
+        if df.empty or not df.columns.is_unique:
+            return {}
+        
+        groups: Dict[np.dtype, List[Any]] = {}
+        for col, dtype in df.dtypes.items():
+            if isinstance(dtype, np.dtype) and dtype.kind in 'iuf':
+                groups.setdefault(dtype, []).append(col)
+        
+        batch_size = max(1, DataProcessor.NUMERIC_STATS_BATCH_CELLS // len(df))
+        stats = {}
+        for dtype, cols in groups.items():
+            for start in range(0, len(cols), batch_size):
+                stats.update(DataProcessor._block_numeric_stats(
+                    df[cols[start:start + batch_size]], dtype, downcast
+                ))
+        return stats
+    
+    @staticmethod
+    def _block_numeric_stats(block: pd.DataFrame, dtype: np.dtype, downcast: bool) -> Dict[Any, Dict[str, Any]]:
+        """Numeric profile stats for one same-dtype column batch; empty if it fails"""
+        try:
+            col_min, col_max = block.min(), block.max()
+            if downcast and dtype.kind in 'iu':
+                low, high = col_min.min(), col_max.max()
+                candidates = UNSIGNED_INT_TYPES if low >= 0 else SIGNED_INT_TYPES
+                narrow = next(name for name, info in candidates if info.min <= low and high <= info.max)
+                block = block.astype(narrow)
+            quartiles = block.quantile([0.25, 0.5, 0.75])
+            # Mean and std stay per column: a 2-D reduction sums in a different order
+            # and can move the last digits away from Series.mean
+            mean = {col: block[col].mean() for col in block.columns}
+            std = {col: block[col].std() for col in block.columns}
+        except (TypeError, ValueError):
+            return {}
+        
+        # Series.median keeps float32 (and float16) columns in their own type
+        median_type = dtype.type if dtype.kind == 'f' else np.float64
+        return {
+            col: {
+                'mean': mean[col],
+                'median': median_type(quartiles[col].iloc[1]),
+                'std': std[col],
+                'min': col_min[col],
+                'max': col_max[col],
+                'q25': quartiles[col].iloc[0],
+                'q75': quartiles[col].iloc[2]
+            }
+            for col in block.columns
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _dtype_kind(dtype: Any) -> str:
+        """Classify a dtype for the per-column checks; cached because frames repeat a few dtypes.
+
+        The cache is bounded since a CategoricalDtype key holds on to its categories.
+        """
+        if pd.api.types.is_integer_dtype(dtype):
+            return 'integer'
+        if pd.api.types.is_numeric_dtype(dtype):
+            return 'numeric'
+        if pd.api.types.is_object_dtype(dtype):
+            return 'text'
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return 'datetime'
+        if str(dtype) == 'bool':
+            return 'bool'
+        return 'other'
+    
+    @staticmethod
+    def _profile_column(df: pd.DataFrame, null_counts: pd.Series,
+                        numeric_stats: Dict[Any, Dict[str, Any]], col: Any) -> Dict[str, Any]:
+        """Profile a single column of get_data_profile's frame"""
+        try:
+            # Look the column and its dtype up once for all the checks below
+            series = df[col]
+            dtype = series.dtype
+            null_count = null_counts[col]
+            # nunique stays per column so an unhashable column only fails its own entry
+            unique_count = series.nunique()
+            col_info = {
+                'dtype': str(dtype),
+                'non_null_count': len(df) - null_count,
+                'null_count': null_count,
+                'null_percentage': (null_count / len(df)) * 100,
+                'unique_count': unique_count,
+                'unique_percentage': (unique_count / len(df)) * 100
+            }
+            
+            # Numeric columns - handle potential boolean string columns
+            kind = DataProcessor._dtype_kind(dtype)
+            is_numeric = kind in ('integer', 'numeric')
+            if is_numeric and col in numeric_stats:
+                col_info.update(numeric_stats[col])
+            elif is_numeric:
+                # Check if it's actually numeric and not boolean strings
+                try:
+                    # Columns left to this path are mostly nullable dtypes, whose scalar
+                    # median and quantiles differ in type from one list-quantile call
+                    col_info.update({
+                        'mean': series.mean(),
+                        'median': series.median(),
+                        'std': series.std(),
+                        'min': series.min(),
+                        'max': series.max(),
+                        'q25': series.quantile(0.25),
+                        'q75': series.quantile(0.75)
+                    })
+                except (TypeError, ValueError) as e:
+                    # Handle cases where numeric operations fail (e.g., boolean strings)
+                    col_info['numeric_stats_error'] = str(e)
+            
+            # Text columns
+            elif kind == 'text':
+                try:
+                    # Measure lengths once; only stringify when the column holds
+                    # missing or non-string values
+                    if null_count == 0 and pd.api.types.infer_dtype(series, skipna=False) == 'string':
+                        # All plain str: one C-level len() per value straight into an int64 array
+                        values = series.to_numpy()
+                        lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+                    else:
+                        lengths = series.astype(str).str.len()
+                    col_info.update({
+                        'max_length': lengths.max(),
+                        'min_length': lengths.min(),
+                        'avg_length': lengths.mean()
+                    })
+                    if unique_count > DataProcessor.MOST_COMMON_MAX_UNIQUE:
+                        col_info['most_common_skipped_high_cardinality'] = True
+                    elif unique_count == len(df) - null_count:
+                        # Every value occurs once, so the top five are the first five in order
+                        col_info['most_common'] = dict.fromkeys(series.dropna().iloc[:5], 1)
+                    else:
+                        # Top five without sorting the whole frequency table
+                        col_info['most_common'] = series.value_counts(sort=False).nlargest(5).to_dict()
+                except Exception as e:
+                    col_info['text_stats_error'] = str(e)
+            
+            # Datetime columns
+            elif kind == 'datetime':
+                try:
+                    earliest = series.min()
+                    latest = series.max()
+                    col_info.update({
+                        'earliest': earliest,
+                        'latest': latest,
+                        'date_range_days': (latest - earliest).days
+                    })
+                except Exception as e:
+                    col_info['datetime_stats_error'] = str(e)
+            
+            # Boolean columns (including string booleans)
+            elif kind == 'bool' or DataProcessor._is_boolean_column(series):
+                try:
+                    # Convert string booleans to actual booleans for analysis
+                    if kind == 'text':
+                        bool_series = series.astype(str).str.lower().map(DataProcessor.BOOL_MAP)
+                    else:
+                        bool_series = series.astype(bool)
+                    
+                    col_info.update({
+                        'true_count': bool_series.sum(),
+                        'false_count': (~bool_series).sum(),
+                        'true_percentage': (bool_series.sum() / len(bool_series)) * 100,
+                        'false_percentage': ((~bool_series).sum() / len(bool_series)) * 100
+                    })
+                except Exception as e:
+                    col_info['boolean_stats_error'] = str(e)
+            
+            return col_info
+            
+        except Exception as col_error:
+            # If individual column processing fails, add error info
+            return {
+                'dtype': str(df[col].dtype),
+                'processing_error': str(col_error)
+            }
+    
+    
     @staticmethod
     def detect_column_types(df: pd.DataFrame) -> Dict[str, str]:
         """Detect and suggest optimal column types"""
         suggestions = {}
         
         for col in df.columns:
-            current_type = str(df[col].dtype)
+            dtype = df[col].dtype
+            current_type = str(dtype)
+            kind = DataProcessor._dtype_kind(dtype)
             
             # Skip if already datetime
-            if pd.api.types.is_datetime64_any_dtype(df[col]):
+            if kind == 'datetime':
                 suggestions[col] = 'datetime'
                 continue
             
             # Try to detect dates
-            if pd.api.types.is_object_dtype(df[col]):
+            if kind == 'text':
                 sample_values = df[col].dropna().head(100)
                 
-                # Check if it looks like dates
-                date_like_count = 0
-                for val in sample_values:
-                    try:
-                        pd.to_datetime(val)
-                        date_like_count += 1
-                    except:
-                        pass
+                # Check if it looks like dates; 'mixed' parses each value on its own
+                # format, like the per-value calls it replaces
+                head = sample_values.iloc[:DataProcessor.DATE_PROBE_ROWS]
+                date_like_count = pd.to_datetime(head, errors='coerce', format='mixed').notna().sum()
+                
+                # Stop early once the head alone has too many misses for the sample to reach 80%
+                if len(head) - date_like_count < len(sample_values) * 0.2:
+                    rest = sample_values.iloc[DataProcessor.DATE_PROBE_ROWS:]
+                    date_like_count += pd.to_datetime(rest, errors='coerce', format='mixed').notna().sum()
                 
                 if date_like_count > len(sample_values) * 0.8:
                     suggestions[col] = 'datetime'
                     continue
             
             # Check if numeric columns can be optimized
-            if pd.api.types.is_numeric_dtype(df[col]):
-                if pd.api.types.is_integer_dtype(df[col]):
-                    max_val = df[col].max()
-                    min_val = df[col].min()
-                    
-                    if min_val >= 0:
-                        if max_val <= 255:
-                            suggestions[col] = 'uint8'
-                        elif max_val <= 65535:
-                            suggestions[col] = 'uint16'
-                        elif max_val <= 4294967295:
-                            suggestions[col] = 'uint32'
-                        else:
-                            suggestions[col] = 'uint64'
+            if kind in ('integer', 'numeric'):
+                if kind == 'integer':
+                    values = df[col].to_numpy()
+                    if values.dtype.kind in 'iu' and len(values):
+                        min_val, max_val = values.min(), values.max()
                     else:
-                        if min_val >= -128 and max_val <= 127:
-                            suggestions[col] = 'int8'
-                        elif min_val >= -32768 and max_val <= 32767:
-                            suggestions[col] = 'int16'
-                        elif min_val >= -2147483648 and max_val <= 2147483647:
-                            suggestions[col] = 'int32'
-                        else:
-                            suggestions[col] = 'int64'
+                        # Nullable or empty columns keep the NA-aware reductions
+                        min_val, max_val = df[col].min(), df[col].max()
+                    
+                    candidates = UNSIGNED_INT_TYPES if min_val >= 0 else SIGNED_INT_TYPES
+                    suggestions[col] = next(
+                        (name for name, info in candidates if info.min <= min_val and max_val <= info.max),
+                        candidates[-1][0]
+                    )
                 else:
-                    suggestions[col] = 'float32' if df[col].dtype == 'float64' else current_type
+                    suggestions[col] = 'float32' if dtype == 'float64' else current_type
             else:
-                # Check if categorical
-                if df[col].nunique() / len(df) < 0.1 and df[col].nunique() < 50:
+                # Check if categorical; under 50 distinct values are needed, so a head that
+                # already has 50 rules the column out without counting all of it
+                if df[col].head(DataProcessor.CATEGORY_PROBE_ROWS).nunique() >= 50:
+                    suggestions[col] = current_type
+                    continue
+                unique_count = df[col].nunique()
+                if unique_count / len(df) < 0.1 and unique_count < 50:
                     suggestions[col] = 'category'
                 else:
                     suggestions[col] = current_type
@@ -296,19 +577,30 @@ class DataProcessor:
     @staticmethod
     def clean_column_names(df: pd.DataFrame) -> pd.DataFrame:
         """Clean column names for better SQL compatibility"""
-        df_clean = df.copy()
-        original_columns = df_clean.columns.copy()
+        original_columns = df.columns
         
-        # Replace spaces and special characters
-        df_clean.columns = df_clean.columns.str.replace(' ', '_')
-        df_clean.columns = df_clean.columns.str.replace('[^A-Za-z0-9_]', '', regex=True)
-        df_clean.columns = df_clean.columns.str.lower()
+        # Replace spaces and special characters; the label list is short, so a
+        # precompiled pattern in plain Python beats the vectorized .str path
+        cols = [
+            DataProcessor.INVALID_COLUMN_CHARS.sub('', str(col).replace(' ', '_')).lower()
+            for col in original_columns
+        ]
         
-        # Ensure no duplicate column names
-        cols = pd.Series(df_clean.columns)
-        for dup in cols[cols.duplicated()].unique():
-            cols[cols == dup] = [f"{dup}_{i}" for i in range(sum(cols == dup))]
-        df_clean.columns = cols
+        # Ensure no duplicate column names: every copy of a repeated name gets a _<n> suffix
+        counts = Counter(cols)
+        seen = defaultdict(int)
+        for i, name in enumerate(cols):
+            if counts[name] > 1:
+                cols[i] = f"{name}_{seen[name]}"
+                seen[name] += 1
+        
+        if cols == list(original_columns):
+            # Names are already clean; nothing to relabel
+            df_clean = df
+        else:
+            # Only the labels change, so a shallow copy avoids copying the data
+            df_clean = df.copy(deep=False)
+            df_clean.columns = cols
         
         # Store column mapping for user reference
         column_mapping = dict(zip(original_columns, df_clean.columns))
@@ -333,7 +625,6 @@ class DataProcessor:
             return df, False
         
         # For categorical columns, ensure all categories are represented
-        sampled_df = df.copy()
         is_sampled = True
         
         # Try stratified sampling if there are categorical columns
@@ -343,10 +634,17 @@ class DataProcessor:
             # Use the first categorical column for stratification
             strat_col = categorical_cols[0]
             try:
-                # Sample proportionally from each category
-                sample_df = df.groupby(strat_col, group_keys=False).apply(
-                    lambda x: x.sample(min(len(x), max_rows // df[strat_col].nunique() + 1))
-                ).reset_index(drop=True)
+                # Sample proportionally from each category: shuffle rows within their
+                # category and keep the first quota rows of each (missing values are skipped)
+                codes, categories = pd.factorize(df[strat_col], sort=True)
+                quota = max_rows // len(categories) + 1
+                rows = np.flatnonzero(codes >= 0)
+                # A stable sort of shuffled rows by code groups them without sorting random keys too
+                shuffled = np.random.default_rng(42).permutation(rows)
+                order = shuffled[np.argsort(codes[shuffled], kind='stable')]
+                group_starts = np.concatenate(([0], np.cumsum(np.bincount(codes[rows]))[:-1]))
+                rank = np.arange(len(order)) - group_starts[codes[order]]
+                sample_df = df.iloc[order[rank < quota]].reset_index(drop=True)
                 
                 if len(sample_df) <= max_rows:
                     return sample_df, is_sampled
@@ -356,59 +654,92 @@ class DataProcessor:
         # Fallback to random sampling
         return df.sample(n=max_rows, random_state=42).reset_index(drop=True), is_sampled
     
+    @staticmethod
+    def _boolean_lookup(series: pd.Series) -> Optional[Dict[Any, bool]]:
+        """Map each distinct value of a boolean-like object column to its bool, or None"""
+        if DataProcessor._dtype_kind(series.dtype) != 'text':
+            return None
+        
+        def lookup_for(values: pd.Series) -> Optional[Dict[Any, bool]]:
+            unique_vals = values.dropna().unique()
+            if len(unique_vals) > 2:
+                return None
+            # Only the distinct values are lower-cased; strings need no str() round trip
+            lowered = [(val if isinstance(val, str) else str(val)).lower() for val in unique_vals]
+            if not all(val in DataProcessor.BOOL_VALUES for val in lowered):
+                return None
+            return {val: DataProcessor.BOOL_MAP[low] for val, low in zip(unique_vals, lowered)}
+        
+        # A head that already fails rules out the whole column without hashing all of it
+        if len(series) > DataProcessor.BOOLEAN_PROBE_ROWS:
+            if lookup_for(series.iloc[:DataProcessor.BOOLEAN_PROBE_ROWS]) is None:
+                return None
+        return lookup_for(series)
+    
     @staticmethod
     def _is_boolean_column(series: pd.Series) -> bool:
         """Check if a column contains boolean-like values"""
-        if pd.api.types.is_object_dtype(series):
-            unique_vals = series.dropna().unique()
-            if len(unique_vals) <= 2:
-                # Check if all values are boolean-like
-                bool_like = all(str(val).lower() in ['true', 'false', '1', '0', 'yes', 'no'] for val in unique_vals)
-                return bool_like
-        return False
+        return DataProcessor._boolean_lookup(series) is not None
     
     @staticmethod
     def _convert_string_booleans(df: pd.DataFrame) -> pd.DataFrame:
         """Convert string boolean values to actual boolean type"""
-        df_clean = df.copy()
-        
-        for col in df_clean.columns:
-            if pd.api.types.is_object_dtype(df_clean[col]):
-                # Check if column contains only boolean-like strings
-                unique_vals = df_clean[col].dropna().unique()
-                if len(unique_vals) <= 2:
-                    # Check if all values are boolean-like
-                    bool_like = all(str(val).lower() in ['true', 'false', '1', '0', 'yes', 'no'] for val in unique_vals)
-                    if bool_like:
-                        try:
-                            # Convert to boolean
-                            df_clean[col] = df_clean[col].astype(str).str.lower().map({
-                                'true': True, 'false': False,
-                                '1': True, '0': False,
-                                'yes': True, 'no': False
-                            })
-                        except Exception:
-                            # If conversion fails, keep as is
-                            pass
+        lookups = {}
+        for col in df.columns:
+            lookup = DataProcessor._boolean_lookup(df[col])
+            if lookup is not None:
+                lookups[col] = lookup
+        if not lookups:
+            return df
+        
+        # Converted columns are replaced whole, so a shallow copy keeps the caller's frame intact
+        df_clean = df.copy(deep=False)
+        for col, lookup in lookups.items():
+            try:
+                # One hash lookup per row against the distinct values; missing values stay missing
+                df_clean[col] = df_clean[col].map(lookup)
+            except Exception:
+                # If conversion fails, keep as is
+                pass
         
         return df_clean
     
+    @staticmethod
+    def _excel_engine() -> str:
+        """Excel writer engine: xlsxwriter writes cells without building openpyxl's
+        cell objects; openpyxl stays as the fallback when it is not installed"""
+        try:
+            import xlsxwriter  # noqa: F401
+            return 'xlsxwriter'
+        except ImportError:
+            return 'openpyxl'
+    
     @staticmethod
     def export_to_format(df: pd.DataFrame, format_type: str) -> bytes:
         """Export DataFrame to specified format"""
         try:
             if format_type == 'csv':
-                return df.to_csv(index=False).encode('utf-8')
+                # Write encoded chunks straight into the buffer instead of building one str
+                buffer = BytesIO()
+                df.to_csv(buffer, index=False, encoding='utf-8', chunksize=100_000)
+                return buffer.getvalue()
             elif format_type == 'json':
-                return df.to_json(orient='records', indent=2).encode('utf-8')
+                # pandas' serializer is already in C; writing into the buffer saves the str copy
+                buffer = BytesIO()
+                df.to_json(buffer, orient='records', indent=2)
+                return buffer.getvalue()
             elif format_type == 'excel':
                 buffer = BytesIO()
-                with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
+                with pd.ExcelWriter(buffer, engine=DataProcessor._excel_engine()) as writer:
                     df.to_excel(writer, index=False, sheet_name='Data')
                 return buffer.getvalue()
             elif format_type == 'parquet':
                 buffer = BytesIO()
-                df.to_parquet(buffer, index=False)
+                # zstd with dictionary-encoded columns gives smaller files than the snappy default
+                df.to_parquet(
+                    buffer, index=False, engine='pyarrow', compression='zstd',
+                    compression_level=3, use_dictionary=True, data_page_size=1 << 20
+                )
                 return buffer.getvalue()
             else:
                 raise ValueError(f"Unsupported format: {format_type}")
@@ -448,6 +779,8 @@ class DataProcessor:
             'profile': profile
         }
         
+        # default=str fixes the file format (numpy scalars and timestamps as strings, NaN kept);
+        # the profile holds a handful of values per column, so the stdlib encoder is not a bottleneck
         return json.dumps(profile_with_metadata, indent=2, default=str).encode('utf-8')
     
     @staticmethod
@@ -455,7 +788,7 @@ class DataProcessor:
         """Generate Excel format data profile with multiple sheets"""
         buffer = BytesIO()
         
-        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
+        with pd.ExcelWriter(buffer, engine=DataProcessor._excel_engine()) as writer:
             # Summary sheet
             summary_data = [
                 ['Metric', 'Value'],
@@ -534,7 +867,9 @@ class DataProcessor:
     @staticmethod
     def _generate_html_profile(df: pd.DataFrame, profile: Dict[str, Any]) -> bytes:
         """Generate HTML format data profile with styling"""
-        html_content = f"""
+        # Collect the pieces and join once instead of re-concatenating a growing string
+        escape = html.escape
+        parts = [f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -563,52 +898,56 @@ class DataProcessor:
             <div class="metric">
                 <strong>Total Rows:</strong> {df.shape[0]:,}<br>
                 <strong>Total Columns:</strong> {df.shape[1]}<br>
-                <strong>Memory Usage:</strong> {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB<br>
+                <strong>Memory Usage:</strong> {DataProcessor.estimate_memory_usage(df) / 1024**2:.2f} MB<br>
                 <strong>Data Types:</strong> {len(df.dtypes.unique())} unique types
             </div>
             
             <h2>Data Types Distribution</h2>
             <table>
                 <tr><th>Data Type</th><th>Count</th><th>Percentage</th></tr>
-        """
+        """]
         
-        for dtype, count in profile['basic_info']['data_types'].items():
-            html_content += f"<tr><td>{html.escape(str(dtype))}</td><td>{count}</td><td>{count / profile['basic_info']['rows'] * 100:.2f}%</td></tr>"
+        rows = profile['basic_info']['rows']
+        parts.extend(
+            f"<tr><td>{escape(str(dtype))}</td><td>{count}</td><td>{count / rows * 100:.2f}%</td></tr>"
+            for dtype, count in profile['basic_info']['data_types'].items()
+        )
         
-        html_content += """
+        parts.append("""
                 </table>
             </div>
-        """
+        """)
         
         # Missing data section
         if profile['missing_data']['columns_with_missing']:
-            html_content += """
+            parts.append("""
             <h2>Missing Data Analysis</h2>
             <table>
                 <tr><th>Column</th><th>Missing Count</th><th>Missing Percentage</th></tr>
-            """
+            """)
             
-            for col, missing_count in profile['missing_data']['columns_with_missing'].items():
-                missing_pct = (missing_count / len(df)) * 100
-                html_content += f"<tr><td>{html.escape(col)}</td><td>{missing_count:,}</td><td>{missing_pct:.2f}%</td></tr>"
+            parts.extend(
+                f"<tr><td>{escape(col)}</td><td>{missing_count:,}</td><td>{(missing_count / len(df)) * 100:.2f}%</td></tr>"
+                for col, missing_count in profile['missing_data']['columns_with_missing'].items()
+            )
             
-            html_content += """
+            parts.append("""
                 </table>
             </div>
-            """
+            """)
         
         # Column details section
-        html_content += """
+        parts.append("""
             <h2>Column Details</h2>
             <table>
                 <tr><th>Column</th><th>Data Type</th><th>Non-null</th><th>Null</th><th>Null %</th><th>Unique</th><th>Unique %</th></tr>
-        """
+        """)
         
-        for col, col_info in profile['column_info'].items():
-            html_content += f"""
+        parts.extend(
+            f"""
                 <tr>
-                    <td>{html.escape(col)}</td>
-                    <td>{html.escape(str(col_info.get('dtype', 'N/A')))}</td>
+                    <td>{escape(col)}</td>
+                    <td>{escape(str(col_info.get('dtype', 'N/A')))}</td>
                     <td>{col_info.get('non_null_count', 0):,}</td>
                     <td>{col_info.get('null_count', 0):,}</td>
                     <td>{col_info.get('null_percentage', 0):.2f}%</td>
@@ -616,16 +955,18 @@ class DataProcessor:
                     <td>{col_info.get('unique_percentage', 0):.2f}%</td>
                 </tr>
             """
+            for col, col_info in profile['column_info'].items()
+        )
         
-        html_content += """
+        parts.append("""
                 </table>
             </div>
-        """
+        """)
         
         # Data quality insights
-        html_content += """
+        parts.append("""
             <h2>Data Quality Insights</h2>
-        """
+        """)
         
         # Check for potential issues
         issues = []
@@ -636,20 +977,19 @@ class DataProcessor:
             issues.append(f"High duplicate rate: {profile['duplicates']['duplicate_percentage']:.1f}%")
         
         if issues:
-            html_content += '<div class="warning"><h3>Potential Issues:</h3><ul>'
-            for issue in issues:
-                html_content += f'<li>{issue}</li>'
-            html_content += '</ul></div>'
+            parts.append('<div class="warning"><h3>Potential Issues:</h3><ul>')
+            parts.extend(f'<li>{issue}</li>' for issue in issues)
+            parts.append('</ul></div>')
         else:
-            html_content += '<div class="success"><h3>Data Quality Assessment:</h3><p>No major data quality issues detected.</p></div>'
+            parts.append('<div class="success"><h3>Data Quality Assessment:</h3><p>No major data quality issues detected.</p></div>')
         
-        html_content += """
+        parts.append("""
             </div>
         </body>
         </html>
-        """
+        """)
         
-        return html_content.encode('utf-8')
+        return ''.join(parts).encode('utf-8')
     
     @staticmethod
     def _generate_csv_profile(df: pd.DataFrame, profile: Dict[str, Any]) -> bytes: